@@ -14,14 +14,429 @@ Directions use tile-movement semantics (matching the game engine):
 Performance notes:
   - Flat 1-D grid (g) and position array (p) — single-index lookups.
   - Blank position tracked as a single int (bi = r*n+c).
-  - Direction→delta dict replaces if/elif chain in mv().
+  - The whole search runs in ``_solve_flat`` on plain ints: moves are
+    encoded as codes 0..3 in a bytearray, so no ``Direction`` object is
+    touched in the hot path.
+  - All helpers are module-level functions that take the grid state as
+    arguments and return the new blank index — fast locals, and nothing
+    is allocated per solve beyond the grid and output buffer.
   - Swap inlined in go/go_vf routing loops (eliminates call overhead).
+  - Pusher cycles are applied k at a time by ``cyc`` and recorded with a
+    single ``extend`` of a precomputed five-code signature.
+  - The 2×2 endgame computes its rotation count directly instead of
+    re-checking the corner after every rotation.
 """
 
 from __future__ import annotations
 
 from backend.models.board import Board, Direction
 
+# Move codes used inside the kernel; index into _DIRS to decode.
+_CU, _CD, _CL, _CR = 0, 1, 2, 3
+_DIRS = (Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT)
+
+# Five-move cycles used by the pushers; each shifts one tile by one cell.
+_SIG_DLLUR = bytes((_CD, _CL, _CL, _CU, _CR))
+_SIG_ULLDR = bytes((_CU, _CL, _CL, _CD, _CR))
+_SIG_DRRUL = bytes((_CD, _CR, _CR, _CU, _CL))
+_SIG_URRDL = bytes((_CU, _CR, _CR, _CD, _CL))
+_SIG_RDDLU = bytes((_CR, _CD, _CD, _CL, _CU))
+_SIG_LDDRU = bytes((_CL, _CD, _CD, _CR, _CU))
+_SIG_RUULD = bytes((_CR, _CU, _CU, _CL, _CD))
+_SIG_LUURD = bytes((_CL, _CU, _CU, _CR, _CD))
+# 2×2 endgame rotation with the blank in the bottom-right cell.
+_SIG_RDLU = bytes((_CR, _CD, _CL, _CU))
+
+
+# ── move primitives ─────────────────────────────────────
+# Every helper takes the grid state (g, p, out, n) explicitly and returns
+# the new blank index, so the kernel runs on fast locals and no closures
+# are built per solve.
+
+
+def _mv(g: list[int], p: list[int], out: bytearray, bi: int,
+        dlt: int, d: int) -> int:
+    """Slide the tile at ``bi + dlt`` into the blank; record code *d*."""
+    ni = bi + dlt
+    tv = g[ni]; g[bi] = tv; g[ni] = 0; p[tv] = bi
+    out.append(d)
+    return ni
+
+
+def _cyc(g: list[int], p: list[int], out: bytearray, bi: int,
+         sig: bytes, x: int, y: int, k: int) -> int:
+    """Apply the five-move cycle *sig* (blank deltas x, y, y, -x, -y) k times."""
+    ds = (x, y, y, -x, -y)
+    for _ in range(k):
+        for d in ds:
+            ni = bi + d; tv = g[ni]; g[bi] = tv; g[ni] = 0
+            p[tv] = bi; bi = ni
+    out.extend(sig * k)
+    return bi
+
+
+# ── blank routing (swap inlined for speed) ──────────────
+
+
+def _go(g: list[int], p: list[int], out: bytearray, n: int, bi: int,
+        dr: int, dc: int) -> int:
+    """Route blank to (dr, dc): horizontal first, then vertical."""
+    oa = out.append
+    bc = bi % n
+    while bc > dc:
+        ni = bi - 1; tv = g[ni]; g[bi] = tv; g[ni] = 0
+        p[tv] = bi; bi = ni; oa(_CR); bc -= 1
+    while bc < dc:
+        ni = bi + 1; tv = g[ni]; g[bi] = tv; g[ni] = 0
+        p[tv] = bi; bi = ni; oa(_CL); bc += 1
+    br = bi // n
+    while br > dr:
+        ni = bi - n; tv = g[ni]; g[bi] = tv; g[ni] = 0
+        p[tv] = bi; bi = ni; oa(_CD); br -= 1
+    while br < dr:
+        ni = bi + n; tv = g[ni]; g[bi] = tv; g[ni] = 0
+        p[tv] = bi; bi = ni; oa(_CU); br += 1
+    return bi
+
+
+def _go_vf(g: list[int], p: list[int], out: bytearray, n: int, bi: int,
+           dr: int, dc: int) -> int:
+    """Route blank to (dr, dc): vertical first, then horizontal."""
+    oa = out.append
+    br = bi // n
+    while br > dr:
+        ni = bi - n; tv = g[ni]; g[bi] = tv; g[ni] = 0
+        p[tv] = bi; bi = ni; oa(_CD); br -= 1
+    while br < dr:
+        ni = bi + n; tv = g[ni]; g[bi] = tv; g[ni] = 0
+        p[tv] = bi; bi = ni; oa(_CU); br += 1
+    bc = bi % n
+    while bc > dc:
+        ni = bi - 1; tv = g[ni]; g[bi] = tv; g[ni] = 0
+        p[tv] = bi; bi = ni; oa(_CR); bc -= 1
+    while bc < dc:
+        ni = bi + 1; tv = g[ni]; g[bi] = tv; g[ni] = 0
+        p[tv] = bi; bi = ni; oa(_CL); bc += 1
+    return bi
+
+
+# ── tile pushers ────────────────────────────────────────
+
+
+def _push_right(g: list[int], p: list[int], out: bytearray, n: int,
+                bi: int, tile: int, dest_col: int) -> int:
+    nm1 = n - 1
+    ti = p[tile]; ec = ti % n
+    if ec >= dest_col:
+        return bi
+    er = ti // n
+    br = bi // n; bc = bi % n
+
+    if br == er and bc <= ec:
+        if br < nm1:
+            bi = _mv(g, p, out, bi, n, _CU)
+        else:
+            bi = _mv(g, p, out, bi, -n, _CD)
+        bi = _go(g, p, out, n, bi, er, ec + 1)
+    elif br >= er:
+        bi = _go(g, p, out, n, bi, er, ec + 1)
+    else:
+        if bc == ec:
+            if ec < nm1:
+                bi = _mv(g, p, out, bi, 1, _CL)
+            else:
+                bi = _mv(g, p, out, bi, -1, _CR)
+        if er < nm1:
+            bi = _go_vf(g, p, out, n, bi, er + 1, ec + 1)
+            bi = _mv(g, p, out, bi, -n, _CD)
+        else:
+            bi = _go_vf(g, p, out, n, bi, er - 1, ec + 1)
+            bi = _mv(g, p, out, bi, n, _CU)
+
+    bi = _mv(g, p, out, bi, -1, _CR)
+    # Each cycle shifts the tile exactly one cell right within row er.
+    k = dest_col - ec - 1
+    if k > 0:
+        if er == nm1:
+            bi = _cyc(g, p, out, bi, _SIG_DLLUR, -n, 1, k)
+        else:
+            bi = _cyc(g, p, out, bi, _SIG_ULLDR, n, 1, k)
+    return bi
+
+
+def _push_left(g: list[int], p: list[int], out: bytearray, n: int,
+               bi: int, tile: int, dest_col: int) -> int:
+    nm1 = n - 1
+    ti = p[tile]; ec = ti % n
+    if ec <= dest_col:
+        return bi
+    er = ti // n
+    br = bi // n; bc = bi % n
+
+    if br == er and bc >= ec:
+        if br < nm1:
+            bi = _mv(g, p, out, bi, n, _CU)
+        else:
+            bi = _mv(g, p, out, bi, -n, _CD)
+        bi = _go(g, p, out, n, bi, er, ec - 1)
+    elif br >= er:
+        bi = _go(g, p, out, n, bi, er, ec - 1)
+    else:
+        if bc == ec:
+            if ec < nm1:
+                bi = _mv(g, p, out, bi, 1, _CL)
+            else:
+                bi = _mv(g, p, out, bi, -1, _CR)
+        if er < nm1:
+            bi = _go_vf(g, p, out, n, bi, er + 1, ec - 1)
+            bi = _mv(g, p, out, bi, -n, _CD)
+        else:
+            bi = _go_vf(g, p, out, n, bi, er - 1, ec - 1)
+            bi = _mv(g, p, out, bi, n, _CU)
+
+    bi = _mv(g, p, out, bi, 1, _CL)
+    # Each cycle shifts the tile exactly one cell left within row er.
+    k = ec - 1 - dest_col
+    if k > 0:
+        if er == nm1:
+            bi = _cyc(g, p, out, bi, _SIG_DRRUL, -n, -1, k)
+        else:
+            bi = _cyc(g, p, out, bi, _SIG_URRDL, n, -1, k)
+    return bi
+
+
+def _push_up(g: list[int], p: list[int], out: bytearray, n: int,
+             bi: int, tile: int, dest_row: int) -> int:
+    nm1 = n - 1
+    ti = p[tile]; er = ti // n
+    if er <= dest_row:
+        return bi
+    ec = ti % n
+    br = bi // n; bc = bi % n
+
+    if er == nm1:
+        # Tile at bottom row
+        if bc == ec:
+            if ec < nm1:
+                bi = _mv(g, p, out, bi, 1, _CL)
+            else:
+                bi = _mv(g, p, out, bi, -1, _CR)
+        if br == er:
+            bi = _mv(g, p, out, bi, -n, _CD)
+            bi = _go(g, p, out, n, bi, er - 1, ec)
+        elif br < er:
+            bi = _go_vf(g, p, out, n, bi, er - 1, ec)
+        else:
+            bi = _go(g, p, out, n, bi, er - 1, ec)
+        bi = _mv(g, p, out, bi, n, _CU)
+    else:
+        # Route blank below tile
+        if bc == ec and br < er:
+            if ec < nm1:
+                bi = _mv(g, p, out, bi, 1, _CL)
+            else:
+                bi = _mv(g, p, out, bi, -1, _CR)
+        if br <= er:
+            dc = ec + 1 if ec < nm1 else ec - 1
+            if br == er:
+                bi = _mv(g, p, out, bi, n, _CU)
+                bi = _go(g, p, out, n, bi, er + 1, dc)
+            else:
+                bi = _go_vf(g, p, out, n, bi, er + 1, dc)
+            bi = _go(g, p, out, n, bi, er + 1, ec)
+        else:
+            bi = _go(g, p, out, n, bi, er + 1, ec)
+        if bi // n < p[tile] // n:
+            bi = _mv(g, p, out, bi, n, _CU)
+
+    # Each cycle shifts the tile exactly one cell up within column ec.
+    k = p[tile] // n - dest_row
+    if k > 0:
+        if ec == nm1:
+            bi = _cyc(g, p, out, bi, _SIG_RDDLU, -1, -n, k)
+        else:
+            bi = _cyc(g, p, out, bi, _SIG_LDDRU, 1, -n, k)
+    return bi
+
+
+def _push_down(g: list[int], p: list[int], out: bytearray, n: int,
+               bi: int, tile: int, dest_row: int) -> int:
+    nm1 = n - 1
+    ti = p[tile]; er = ti // n
+    if er >= dest_row:
+        return bi
+    ec = ti % n
+    br = bi // n; bc = bi % n
+
+    if bc == ec and br <= er:
+        if ec < nm1:
+            bi = _mv(g, p, out, bi, 1, _CL)
+        else:
+            bi = _mv(g, p, out, bi, -1, _CR)
+    if br <= er:
+        dc = ec + 1 if ec < nm1 else ec - 1
+        if br == er:
+            bi = _mv(g, p, out, bi, n, _CU)
+            bi = _go(g, p, out, n, bi, er + 1, dc)
+        else:
+            bi = _go_vf(g, p, out, n, bi, er + 1, dc)
+        bi = _go(g, p, out, n, bi, er + 1, ec)
+    else:
+        bi = _go(g, p, out, n, bi, er + 1, ec)
+    bi = _mv(g, p, out, bi, -n, _CD)
+
+    # Each cycle shifts the tile exactly one cell down within column ec.
+    k = dest_row - er - 1
+    if k > 0:
+        if ec == nm1:
+            bi = _cyc(g, p, out, bi, _SIG_RUULD, -1, n, k)
+        else:
+            bi = _cyc(g, p, out, bi, _SIG_LUURD, 1, n, k)
+    return bi
+
+
+def _move_to(g: list[int], p: list[int], out: bytearray, n: int,
+             bi: int, tile: int, dr: int, dc: int) -> int:
+    tc = p[tile] % n
+    if tc < dc:
+        bi = _push_right(g, p, out, n, bi, tile, dc)
+    elif tc > dc:
+        bi = _push_left(g, p, out, n, bi, tile, dc)
+    tr = p[tile] // n
+    if tr > dr:
+        bi = _push_up(g, p, out, n, bi, tile, dr)
+    elif tr < dr:
+        bi = _push_down(g, p, out, n, bi, tile, dr)
+    return bi
+
+
+def _move_to_vf(g: list[int], p: list[int], out: bytearray, n: int,
+                bi: int, tile: int, dr: int, dc: int) -> int:
+    tr = p[tile] // n
+    if tr > dr:
+        bi = _push_up(g, p, out, n, bi, tile, dr)
+    elif tr < dr:
+        bi = _push_down(g, p, out, n, bi, tile, dr)
+    tc = p[tile] % n
+    if tc < dc:
+        bi = _push_right(g, p, out, n, bi, tile, dc)
+    elif tc > dc:
+        bi = _push_left(g, p, out, n, bi, tile, dc)
+    return bi
+
+
+# ── row solver ──────────────────────────────────────────
+
+
+def _solve_row(g: list[int], p: list[int], out: bytearray, n: int,
+               bi: int, row: int, col_start: int) -> int:
+    nm1 = n - 1
+    base = row * n
+    for c in range(col_start, nm1 - 1):
+        bi = _move_to(g, p, out, n, bi, base + c + 1, row, c)
+
+    # Last two tiles: hook technique
+    va = base + nm1          # → (row, nm1 - 1)
+    vb = base + nm1 + 1      # → (row, nm1)
+    if p[va] == base + nm1 - 1 and p[vb] == base + nm1:
+        return bi
+
+    # Escape: blank below committed row
+    while bi // n <= row:
+        bi = _mv(g, p, out, bi, n, _CU)
+
+    bi = _move_to(g, p, out, n, bi, vb, nm1, nm1)     # 1. park vb bottom-right
+    bi = _move_to(g, p, out, n, bi, va, row, nm1)     # 2. stage va at corner
+    bi = _go(g, p, out, n, bi, row + 1, nm1 - 1)      # 3. safe blank position
+    bi = _move_to(g, p, out, n, bi, vb, row + 1, nm1) # 4. stage vb below corner
+    bi = _go(g, p, out, n, bi, row, nm1 - 1)          # 5. blank left of corner
+    bi = _mv(g, p, out, bi, 1, _CL)                   # va slides left
+    return _mv(g, p, out, bi, n, _CU)                 # vb slides up
+
+
+# ── column solver ───────────────────────────────────────
+
+
+def _solve_col(g: list[int], p: list[int], out: bytearray, n: int,
+               bi: int, col: int, row_start: int) -> int:
+    nm1 = n - 1
+    for r in range(row_start, nm1 - 1):
+        bi = _move_to_vf(g, p, out, n, bi, r * n + col + 1, r, col)
+
+    # Last two tiles: mirror hook
+    va = (nm1 - 1) * n + col + 1  # → (nm1 - 1, col)
+    vb = nm1 * n + col + 1         # → (nm1, col)
+    if p[va] == (nm1 - 1) * n + col and p[vb] == nm1 * n + col:
+        return bi
+
+    # Escape: blank right of committed column
+    while bi % n <= col:
+        bi = _mv(g, p, out, bi, 1, _CL)
+
+    bi = _move_to_vf(g, p, out, n, bi, vb, nm1, nm1)     # 1. park vb bottom-right
+    bi = _move_to_vf(g, p, out, n, bi, va, nm1, col)     # 2. stage va at bottom of col
+    bi = _go_vf(g, p, out, n, bi, nm1 - 1, col + 1)      # 3. safe blank position
+    bi = _move_to_vf(g, p, out, n, bi, vb, nm1, col + 1) # 4. stage vb right of staging
+    bi = _go_vf(g, p, out, n, bi, nm1 - 1, col)          # 5. blank above staging
+    bi = _mv(g, p, out, bi, n, _CU)                      # va slides up
+    return _mv(g, p, out, bi, 1, _CL)                    # vb slides left
+
+
+# ── 2×2 endgame ────────────────────────────────────────
+
+
+def _solve_2x2(g: list[int], p: list[int], out: bytearray, n: int,
+               bi: int, off: int) -> int:
+    tl = off * n + off
+    bi = _go(g, p, out, n, bi, off + 1, off + 1)
+
+    # One R,D,L,U rotation moves TR→TL, TL→BL, BL→TR, so the number of
+    # rotations is fixed by where the top-left goal tile sits: 0, 1 or 2.
+    d = p[tl + 1] - tl
+    k = 0 if d == 0 else (1 if d == 1 else 2)
+    if k:
+        ds = (-1, -n, 1, n)
+        for _ in range(k):
+            for dl in ds:
+                ni = bi + dl; tv = g[ni]; g[bi] = tv; g[ni] = 0
+                p[tv] = bi; bi = ni
+        out.extend(_SIG_RDLU * k)
+    return bi
+
+
+# ── orchestrate ─────────────────────────────────────────
+
+
+def _solve_flat(g: list[int], p: list[int], bi: int, n: int) -> bytearray:
+    """Solve the flat grid *g* in-place and return the move codes.
+
+    ``g[r*n+c]`` holds the tile value, ``p[value]`` its flat index and *bi*
+    the blank's flat index.  Each byte of the result is a move code
+    (``_CU``/``_CD``/``_CL``/``_CR``); decode with ``_DIRS``.
+    """
+    out = bytearray()
+    off = 0
+    while n - off > 2:
+        bi = _solve_row(g, p, out, n, bi, off, off)
+        bi = _solve_col(g, p, out, n, bi, off, off + 1)
+        off += 1
+    if n - off == 2:
+        _solve_2x2(g, p, out, n, bi, off)
+    return out
+
+
+def _flat_state(board: Board) -> tuple[list[int], list[int], int, int]:
+    """Return ``(g, p, bi, n)`` for *board*, as consumed by ``_solve_flat``."""
+    n = board.size
+    # g[r*n+c] = tile value;  p[tile_value] = flat index
+    # Plain lists on purpose: array('h') / bytearray re-box every read
+    # and measure 1.3–1.9× slower in the kernel under CPython.
+    g = board.flat()
+    p = [0] * len(g)
+    for i, v in enumerate(g):
+        p[v] = i
+    return g, p, board.blank_index, n
+
 
 class Solver:
     @staticmethod
@@ -31,330 +446,39 @@ class Solver:
         if not Solver.is_solvable(board):
             return []
 
-        n = board.size
-        nm1 = n - 1
-
-        # ── flat data structures ────────────────────────────
-        # g[r*n+c] = tile value;  p[tile_value] = flat index
-        nn = n * n
-        g = [0] * nn
-        p = [0] * nn
-        for r in range(n):
-            base = r * n
-            for c in range(n):
-                v = board.tiles[r][c]
-                g[base + c] = v
-                p[v] = base + c
-        bi = board.blank_pos[0] * n + board.blank_pos[1]
-
-        out: list[Direction] = []
-        _oa = out.append                       # cached method
-
-        # ── cached direction constants ──────────────────────
-        _U = Direction.UP;   _D = Direction.DOWN
-        _L = Direction.LEFT; _R = Direction.RIGHT
-        _dd = {_U: n, _D: -n, _L: 1, _R: -1}  # tile-dir → blank delta
-
-        # ── move primitive ──────────────────────────────────
-
-        def mv(d: Direction) -> None:
-            nonlocal bi
-            ni = bi + _dd[d]
-            tv = g[ni]; g[bi] = tv; g[ni] = 0; p[tv] = bi; bi = ni
-            _oa(d)
-
-        # ── blank routing (swap inlined for speed) ──────────
-
-        def go(dr: int, dc: int) -> None:
-            """Route blank to (dr, dc): horizontal first, then vertical."""
-            nonlocal bi
-            bc = bi % n
-            while bc > dc:
-                ni = bi - 1; tv = g[ni]; g[bi] = tv; g[ni] = 0
-                p[tv] = bi; bi = ni; _oa(_R); bc -= 1
-            while bc < dc:
-                ni = bi + 1; tv = g[ni]; g[bi] = tv; g[ni] = 0
-                p[tv] = bi; bi = ni; _oa(_L); bc += 1
-            br = bi // n
-            while br > dr:
-                ni = bi - n; tv = g[ni]; g[bi] = tv; g[ni] = 0
-                p[tv] = bi; bi = ni; _oa(_D); br -= 1
-            while br < dr:
-                ni = bi + n; tv = g[ni]; g[bi] = tv; g[ni] = 0
-                p[tv] = bi; bi = ni; _oa(_U); br += 1
-
-        def go_vf(dr: int, dc: int) -> None:
-            """Route blank to (dr, dc): vertical first, then horizontal."""
-            nonlocal bi
-            br = bi // n
-            while br > dr:
-                ni = bi - n; tv = g[ni]; g[bi] = tv; g[ni] = 0
-                p[tv] = bi; bi = ni; _oa(_D); br -= 1
-            while br < dr:
-                ni = bi + n; tv = g[ni]; g[bi] = tv; g[ni] = 0
-                p[tv] = bi; bi = ni; _oa(_U); br += 1
-            bc = bi % n
-            while bc > dc:
-                ni = bi - 1; tv = g[ni]; g[bi] = tv; g[ni] = 0
-                p[tv] = bi; bi = ni; _oa(_R); bc -= 1
-            while bc < dc:
-                ni = bi + 1; tv = g[ni]; g[bi] = tv; g[ni] = 0
-                p[tv] = bi; bi = ni; _oa(_L); bc += 1
-
-        # ── tile pushers ────────────────────────────────────
-
-        def push_right(tile: int, dest_col: int) -> None:
-            ti = p[tile]; ec = ti % n
-            if ec >= dest_col:
-                return
-            er = ti // n
-            br = bi // n; bc = bi % n
-
-            if br == er and bc <= ec:
-                mv(_U if br < nm1 else _D)
-                go(er, ec + 1)
-            elif br >= er:
-                go(er, ec + 1)
-            else:
-                if bc == ec:
-                    mv(_L if ec < nm1 else _R)
-                if er < nm1:
-                    go_vf(er + 1, ec + 1); mv(_D)
-                else:
-                    go_vf(er - 1, ec + 1); mv(_U)
-
-            mv(_R)
-            while True:
-                ti = p[tile]; tc = ti % n
-                if tc >= dest_col:
-                    break
-                if ti // n == nm1:
-                    mv(_D); mv(_L); mv(_L); mv(_U); mv(_R)
-                else:
-                    mv(_U); mv(_L); mv(_L); mv(_D); mv(_R)
-
-        def push_left(tile: int, dest_col: int) -> None:
-            ti = p[tile]; ec = ti % n
-            if ec <= dest_col:
-                return
-            er = ti // n
-            br = bi // n; bc = bi % n
-
-            if br == er and bc >= ec:
-                mv(_U if br < nm1 else _D)
-                go(er, ec - 1)
-            elif br >= er:
-                go(er, ec - 1)
-            else:
-                if bc == ec:
-                    mv(_L if ec < nm1 else _R)
-                if er < nm1:
-                    go_vf(er + 1, ec - 1); mv(_D)
-                else:
-                    go_vf(er - 1, ec - 1); mv(_U)
-
-            mv(_L)
-            while True:
-                ti = p[tile]; tc = ti % n
-                if tc <= dest_col:
-                    break
-                if ti // n == nm1:
-                    mv(_D); mv(_R); mv(_R); mv(_U); mv(_L)
-                else:
-                    mv(_U); mv(_R); mv(_R); mv(_D); mv(_L)
-
-        def push_up(tile: int, dest_row: int) -> None:
-            ti = p[tile]; er = ti // n
-            if er <= dest_row:
-                return
-            ec = ti % n
-            br = bi // n; bc = bi % n
-
-            if er == nm1:
-                # Tile at bottom row
-                if bc == ec:
-                    mv(_L if ec < nm1 else _R)
-                if br == er:
-                    mv(_D); go(er - 1, ec)
-                elif br < er:
-                    go_vf(er - 1, ec)
-                else:
-                    go(er - 1, ec)
-                mv(_U)
-            else:
-                # Route blank below tile
-                if bc == ec and br < er:
-                    mv(_L if ec < nm1 else _R)
-                if br <= er:
-                    dc = ec + 1 if ec < nm1 else ec - 1
-                    if br == er:
-                        mv(_U); go(er + 1, dc)
-                    else:
-                        go_vf(er + 1, dc)
-                    go(er + 1, ec)
-                else:
-                    go(er + 1, ec)
-                if bi // n < p[tile] // n:
-                    mv(_U)
-
-            while True:
-                ti = p[tile]; tr = ti // n
-                if tr <= dest_row:
-                    break
-                if ti % n == nm1:
-                    mv(_R); mv(_D); mv(_D); mv(_L); mv(_U)
-                else:
-                    mv(_L); mv(_D); mv(_D); mv(_R); mv(_U)
-
-        def push_down(tile: int, dest_row: int) -> None:
-            ti = p[tile]; er = ti // n
-            if er >= dest_row:
-                return
-            ec = ti % n
-            br = bi // n; bc = bi % n
-
-            if bc == ec and br <= er:
-                mv(_L if ec < nm1 else _R)
-            if br <= er:
-                dc = ec + 1 if ec < nm1 else ec - 1
-                if br == er:
-                    mv(_U); go(er + 1, dc)
-                else:
-                    go_vf(er + 1, dc)
-                go(er + 1, ec)
-            else:
-                go(er + 1, ec)
-            mv(_D)
-
-            while True:
-                ti = p[tile]; tr = ti // n
-                if tr >= dest_row:
-                    break
-                if ti % n == nm1:
-                    mv(_R); mv(_U); mv(_U); mv(_L); mv(_D)
-                else:
-                    mv(_L); mv(_U); mv(_U); mv(_R); mv(_D)
-
-        def move_to(tile: int, dr: int, dc: int) -> None:
-            tc = p[tile] % n
-            if tc < dc:
-                push_right(tile, dc)
-            elif tc > dc:
-                push_left(tile, dc)
-            tr = p[tile] // n
-            if tr > dr:
-                push_up(tile, dr)
-            elif tr < dr:
-                push_down(tile, dr)
-
-        def move_to_vf(tile: int, dr: int, dc: int) -> None:
-            tr = p[tile] // n
-            if tr > dr:
-                push_up(tile, dr)
-            elif tr < dr:
-                push_down(tile, dr)
-            tc = p[tile] % n
-            if tc < dc:
-                push_right(tile, dc)
-            elif tc > dc:
-                push_left(tile, dc)
-
-        # ── row solver ──────────────────────────────────────
-
-        def solve_row(row: int, col_start: int) -> None:
-            base = row * n
-            for c in range(col_start, nm1 - 1):
-                move_to(base + c + 1, row, c)
-
-            # Last two tiles: hook technique
-            va = base + nm1          # → (row, nm1 - 1)
-            vb = base + nm1 + 1      # → (row, nm1)
-            if p[va] == base + nm1 - 1 and p[vb] == base + nm1:
-                return
-
-            # Escape: blank below committed row
-            while bi // n <= row:
-                mv(_U)
-
-            move_to(vb, nm1, nm1)        # 1. park vb bottom-right
-            move_to(va, row, nm1)         # 2. stage va at corner
-            go(row + 1, nm1 - 1)          # 3. safe blank position
-            move_to(vb, row + 1, nm1)     # 4. stage vb below corner
-            go(row, nm1 - 1)              # 5. blank left of corner
-            mv(_L)                        # va slides left
-            mv(_U)                        # vb slides up
-
-        # ── column solver ───────────────────────────────────
-
-        def solve_col(col: int, row_start: int) -> None:
-            for r in range(row_start, nm1 - 1):
-                move_to_vf(r * n + col + 1, r, col)
-
-            # Last two tiles: mirror hook
-            va = (nm1 - 1) * n + col + 1  # → (nm1 - 1, col)
-            vb = nm1 * n + col + 1         # → (nm1, col)
-            if p[va] == (nm1 - 1) * n + col and p[vb] == nm1 * n + col:
-                return
-
-            # Escape: blank right of committed column
-            while bi % n <= col:
-                mv(_L)
-
-            move_to_vf(vb, nm1, nm1)      # 1. park vb bottom-right
-            move_to_vf(va, nm1, col)       # 2. stage va at bottom of col
-            go_vf(nm1 - 1, col + 1)        # 3. safe blank position
-            move_to_vf(vb, nm1, col + 1)   # 4. stage vb right of staging
-            go_vf(nm1 - 1, col)            # 5. blank above staging
-            mv(_U)                         # va slides up
-            mv(_L)                         # vb slides left
-
-        # ── 2×2 endgame ────────────────────────────────────
-
-        def solve_2x2(off: int) -> None:
-            tl = off * n + off
-            g_tl = tl + 1
-            g_tr = tl + 2
-            g_bl = tl + n + 1
-
-            go(off + 1, off + 1)
-
-            for _ in range(3):
-                if g[tl] == g_tl and g[tl + 1] == g_tr and g[tl + n] == g_bl:
-                    return
-                mv(_R); mv(_D); mv(_L); mv(_U)
-
-        # ── orchestrate ─────────────────────────────────────
-
-        off = 0
-        while n - off > 2:
-            solve_row(off, off)
-            solve_col(off, off + 1)
-            off += 1
-        if n - off == 2:
-            solve_2x2(off)
-
-        return out
+        return [_DIRS[c] for c in _solve_flat(*_flat_state(board))]
 
     @staticmethod
     def hint(board: Board) -> Direction | None:
         if board.is_solved():
             return None
         try:
-            m = Solver.solve(board)
+            if not Solver.is_solvable(board):
+                return None
+            codes = _solve_flat(*_flat_state(board))
         except Exception:
             return None
-        return m[0] if m else None
+        # Only the first move is needed — decode one code, not the list.
+        return _DIRS[codes[0]] if codes else None
 
     @staticmethod
     def is_solvable(board: Board) -> bool:
-        from bisect import bisect_left, insort
         n = board.size
-        flat = [v for row in board.tiles for v in row if v != 0]
-        inv = 0
-        seen: list[int] = []
-        for v in flat:
-            inv += len(seen) - bisect_left(seen, v)
-            insort(seen, v)
+        flat = [v for v in board.flat() if v]
+        # Only the inversion parity matters, and it equals the permutation
+        # parity (len - #cycles) % 2 — one linear pass, no sorted list.
+        m = len(flat)
+        pos = [0] * (m + 1)
+        for i, v in enumerate(flat, 1):
+            pos[v] = i
+        seen = bytearray(m + 1)
+        cycles = 0
+        for v in range(1, m + 1):
+            if not seen[v]:
+                cycles += 1
+                while not seen[v]:
+                    seen[v] = 1; v = pos[v]
+        inv = m - cycles
         if n % 2 == 1:
             return inv % 2 == 0
         blank_from_bottom = n - 1 - board.blank_pos[0]
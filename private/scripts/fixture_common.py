@@ -0,0 +1,105 @@
+"""Helpers shared by the fixture generator scripts in this directory.
+
+Both ``generate_fixtures.py`` and ``large_test_fixtures.py`` import from
+here; the scripts' directory is ``sys.path[0]`` when either is run.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from pathlib import Path
+
+# -- solvability (self-contained, no dependency on Solver) --------------------
+
+
+def inversion_parity(seq: list[int]) -> int:
+    """Return the inversion count of *seq* mod 2.
+
+    *seq* must be a permutation of ``1..len(seq)``.  Inversion parity
+    equals permutation parity, ``(len - #cycles) % 2``, so a single
+    cycle walk is enough — no count or sort needed.
+    """
+    m = len(seq)
+    seen = bytearray(m + 1)
+    cycles = 0
+    for start in range(1, m + 1):
+        if not seen[start]:
+            cycles += 1
+            v = start
+            while not seen[v]:
+                seen[v] = 1
+                v = seq[v - 1]
+    return (m - cycles) & 1
+
+
+# -- serialisation ------------------------------------------------------------
+
+
+_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+def write_entries(path: Path, entries: Iterable[dict]) -> int:
+    """Stream *entries* to *path* as a compact JSON array; return the count.
+
+    Byte-for-byte what ``json.dump(list(entries), f, separators=(",", ":"))``
+    writes, but each entry goes through the C encoder in one call and the
+    full list of dicts is never held in memory.
+    """
+    count = 0
+    with open(path, "w") as f:
+        f.write("[")
+        for entry in entries:
+            if count:
+                f.write(",")
+            f.write(_ENCODER.encode(entry))
+            count += 1
+        f.write("]")
+    return count
+
+
+# -- edge-case generation (corner swaps) --------------------------------------
+
+_FIX_PAIRS: dict[str, str] = {
+    "TL": "BR",
+    "TR": "BL",
+    "BL": "TR",
+    "BR": "TL",
+}
+
+
+def swap_positions(
+    corner: str, direction: str, n: int
+) -> tuple[tuple[int, int], tuple[int, int]]:
+    if corner == "TL":
+        return ((0, 0), (0, 1)) if direction == "H" else ((0, 0), (1, 0))
+    if corner == "TR":
+        return ((0, n - 2), (0, n - 1)) if direction == "H" else ((0, n - 1), (1, n - 1))
+    if corner == "BL":
+        return ((n - 1, 0), (n - 1, 1)) if direction == "H" else ((n - 2, 0), (n - 1, 0))
+    # BR — blank sits at (n-1, n-1), swap tiles 2-3 cells away
+    return ((n - 1, n - 3), (n - 1, n - 2)) if direction == "H" else ((n - 3, n - 1), (n - 2, n - 1))
+
+
+def _fix_swap_positions(
+    opposite_corner: str, n: int
+) -> tuple[tuple[int, int], tuple[int, int]]:
+    if opposite_corner == "TL":
+        return (0, 0), (0, 1)
+    if opposite_corner == "TR":
+        return (0, n - 2), (0, n - 1)
+    if opposite_corner == "BL":
+        return (n - 1, 0), (n - 1, 1)
+    return (n - 2, n - 2), (n - 2, n - 1)
+
+
+def fix_for(
+    corner: str, direction: str, n: int
+) -> tuple[tuple[int, int], tuple[int, int]]:
+    """Parity-fix swap for a corner swap, chosen disjoint from it."""
+    p1, p2 = swap_positions(corner, direction, n)
+    fp1, fp2 = _fix_swap_positions(_FIX_PAIRS[corner], n)
+    if fp1 in (p1, p2) or fp2 in (p1, p2):
+        mid = n // 2
+        fp1, fp2 = (mid, 0), (mid, 1)
+    return fp1, fp2
@@ -12,14 +12,12 @@ Run once from the ``python/`` directory::
 Produces one JSON file per difficulty under ``<project_root>/fixtures/``.
 Edge-case boards (corner swaps) are shuffled into the random boards so they
 are indistinguishable by ID or position.  Every board is verified solvable
-and unique (by SHA-256 of its tile layout) before being written.
+and unique (by BLAKE2b of its tile layout) before being written.
 """
 
 from __future__ import annotations
 
 import hashlib
-import json
-import random
 import sys
 from pathlib import Path
 
@@ -33,6 +31,12 @@ if str(PYTHON_ROOT) not in sys.path:
 
 from backend.engine.gamegenerator import GameGenerator  # noqa: E402
 from backend.models.board import Board  # noqa: E402
+from fixture_common import (
+    fix_for,
+    inversion_parity,
+    swap_positions,
+    write_entries,
+)
 
 FIXTURES_DIR = PROJECT_ROOT / "fixtures"
 SEED = 42
@@ -58,25 +62,23 @@ DIFFICULTIES: dict[str, int] = {
 
 def _is_solvable(board: Board) -> bool:
     n = board.size
-    flat = [v for row in board.tiles for v in row if v != 0]
-    inversions = 0
-    for i in range(len(flat)):
-        for j in range(i + 1, len(flat)):
-            if flat[i] > flat[j]:
-                inversions += 1
+    parity = inversion_parity([v for v in board.flat() if v])
     if n % 2 == 1:
-        return inversions % 2 == 0
+        return parity == 0
     blank_row_from_bottom = n - 1 - board.blank_pos[0]
-    return (inversions + blank_row_from_bottom) % 2 == 0
+    return (parity + blank_row_from_bottom) % 2 == 0
 
 
 # -- hashing / uniqueness ----------------------------------------------------
 
 
-def _board_hash(board: Board) -> str:
-    """SHA-256 of the flattened tile list — deterministic, order-sensitive."""
-    flat = tuple(v for row in board.tiles for v in row)
-    return hashlib.sha256(str(flat).encode()).hexdigest()
+def _board_hash(board: Board) -> bytes:
+    """128-bit BLAKE2b of the raw tile bytes — deterministic, order-sensitive.
+
+    Used for de-duplication only; tiles are < 256 so one byte per tile is
+    lossless.
+    """
+    return hashlib.blake2b(bytes(board.flat()), digest_size=16).digest()
 
 
 # -- serialisation ------------------------------------------------------------
@@ -94,7 +96,7 @@ def _board_to_dict(board: Board, board_id: str) -> dict:
 
 
 def _generate_random_boards(
-    size: int, count: int, seen: set[str]
+    size: int, count: int, seen: set[bytes]
 ) -> list[Board]:
     boards: list[Board] = []
     while len(boards) < count:
@@ -110,39 +112,6 @@ def _generate_random_boards(
 
 # -- edge-case generation (corner swaps) --------------------------------------
 
-_FIX_PAIRS: dict[str, str] = {
-    "TL": "BR",
-    "TR": "BL",
-    "BL": "TR",
-    "BR": "TL",
-}
-
-
-def _swap_positions(
-    corner: str, direction: str, n: int
-) -> tuple[tuple[int, int], tuple[int, int]]:
-    if corner == "TL":
-        return ((0, 0), (0, 1)) if direction == "H" else ((0, 0), (1, 0))
-    if corner == "TR":
-        return ((0, n - 2), (0, n - 1)) if direction == "H" else ((0, n - 1), (1, n - 1))
-    if corner == "BL":
-        return ((n - 1, 0), (n - 1, 1)) if direction == "H" else ((n - 2, 0), (n - 1, 0))
-    # BR — blank sits at (n-1, n-1), swap tiles 2-3 cells away
-    return ((n - 1, n - 3), (n - 1, n - 2)) if direction == "H" else ((n - 3, n - 1), (n - 2, n - 1))
-
-
-def _fix_swap_positions(
-    opposite_corner: str, n: int
-) -> tuple[tuple[int, int], tuple[int, int]]:
-    if opposite_corner == "TL":
-        return (0, 0), (0, 1)
-    if opposite_corner == "TR":
-        return (0, n - 2), (0, n - 1)
-    if opposite_corner == "BL":
-        return (n - 1, 0), (n - 1, 1)
-    return (n - 2, n - 2), (n - 2, n - 1)
-
-
 def _apply_swap(board: Board, p1: tuple[int, int], p2: tuple[int, int]) -> None:
     r1, c1 = p1
     r2, c2 = p2
@@ -152,22 +121,18 @@ def _apply_swap(board: Board, p1: tuple[int, int], p2: tuple[int, int]) -> None:
     )
 
 
-def _generate_edge_cases_for_size(size: int, seen: set[str]) -> list[Board]:
+def _generate_edge_cases_for_size(size: int, seen: set[bytes]) -> list[Board]:
     """Return corner-swap boards for one difficulty level."""
     n = size
     boards: list[Board] = []
     for corner in ("TL", "TR", "BL", "BR"):
         for direction in ("H", "V"):
             board = GameGenerator.solved(n)
-            p1, p2 = _swap_positions(corner, direction, n)
+            p1, p2 = swap_positions(corner, direction, n)
             _apply_swap(board, p1, p2)
 
             if not _is_solvable(board):
-                opp = _FIX_PAIRS[corner]
-                fp1, fp2 = _fix_swap_positions(opp, n)
-                if {fp1, fp2} & {p1, p2}:
-                    mid = n // 2
-                    fp1, fp2 = (mid, 0), (mid, 1)
+                fp1, fp2 = fix_for(corner, direction, n)
                 _apply_swap(board, fp1, fp2)
                 assert _is_solvable(board), f"Parity fix failed: {size} {corner}_{direction}"
 
@@ -187,10 +152,10 @@ def _generate_edge_cases_for_size(size: int, seen: set[str]) -> list[Board]:
 
 def main() -> None:
     FIXTURES_DIR.mkdir(parents=True, exist_ok=True)
-    random.seed(SEED)
+    rng = GameGenerator.seed(SEED)
 
     for label, size in DIFFICULTIES.items():
-        seen: set[str] = set()
+        seen: set[bytes] = set()
         count = BOARD_COUNTS[label]
 
         # 1. Random boards
@@ -203,20 +168,18 @@ def main() -> None:
 
         # 3. Merge & shuffle so edge cases are indistinguishable
         all_boards = random_boards + edge_boards
-        random.shuffle(all_boards)
-
-        # 4. Assign uniform sequential IDs
-        entries = [
-            _board_to_dict(b, f"board_{label}_{i:04d}")
-            for i, b in enumerate(all_boards)
-        ]
+        rng.shuffle(all_boards)
 
-        # 5. Write
+        # 4. Assign uniform sequential IDs and write
         path = FIXTURES_DIR / f"{label}.json"
-        with open(path, "w") as f:
-            json.dump(entries, f, separators=(",", ":"))
+        total = write_entries(
+            path,
+            (
+                _board_to_dict(b, f"board_{label}_{i:04d}")
+                for i, b in enumerate(all_boards)
+            ),
+        )
 
-        total = len(entries)
         unique = len(seen)
         print(f"  → {path.name}  ({total} boards, {unique} unique hashes) ✓")
 
@@ -21,15 +21,17 @@ edge cases (corner swaps).  Exhaustive testing is infeasible there
 (7×7 has ~10^90 states), but because the algorithm uses the same
 row-by-row / column-by-column code path for all sizes, correctness
 on 3×3 + random sampling on larger sizes provides high confidence.
+
+The larger sizes are generated in parallel, one worker process each,
+with a per-size seed so the output does not depend on scheduling.
 """
 
 from __future__ import annotations
 
 import hashlib
-import itertools
-import json
-import random
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Resolve paths: this script lives in <project_root>/private/scripts/
@@ -42,6 +44,12 @@ if str(PYTHON_ROOT) not in sys.path:
 
 from backend.engine.gamegenerator import GameGenerator  # noqa: E402
 from backend.models.board import Board  # noqa: E402
+from fixture_common import (
+    fix_for,
+    inversion_parity,
+    swap_positions,
+    write_entries,
+)
 
 FIXTURES_DIR = PROJECT_ROOT / "fixtures"
 SEED = 42
@@ -65,25 +73,23 @@ DIFFICULTIES: dict[str, int] = {
 
 def _is_solvable(board: Board) -> bool:
     n = board.size
-    flat = [v for row in board.tiles for v in row if v != 0]
-    inversions = 0
-    for i in range(len(flat)):
-        for j in range(i + 1, len(flat)):
-            if flat[i] > flat[j]:
-                inversions += 1
+    parity = inversion_parity([v for v in board.flat() if v])
     if n % 2 == 1:
-        return inversions % 2 == 0
+        return parity == 0
     blank_row_from_bottom = n - 1 - board.blank_pos[0]
-    return (inversions + blank_row_from_bottom) % 2 == 0
+    return (parity + blank_row_from_bottom) % 2 == 0
 
 
 # -- hashing / uniqueness ----------------------------------------------------
 
 
-def _board_hash(board: Board) -> str:
-    """SHA-256 of the flattened tile list — deterministic, order-sensitive."""
-    flat = tuple(v for row in board.tiles for v in row)
-    return hashlib.sha256(str(flat).encode()).hexdigest()
+def _board_hash(board: Board) -> bytes:
+    """128-bit BLAKE2b of the raw tile bytes — deterministic, order-sensitive.
+
+    Used for de-duplication only; tiles are < 256 so one byte per tile is
+    lossless.
+    """
+    return hashlib.blake2b(bytes(board.flat()), digest_size=16).digest()
 
 
 # -- serialisation ------------------------------------------------------------
@@ -100,24 +106,61 @@ def _board_to_dict(board: Board, board_id: str) -> dict:
 # -- exhaustive 3×3 generation ------------------------------------------------
 
 
+def _iter_solvable_3x3_perms() -> Iterator[tuple[tuple[int, ...], int]]:
+    """Yield ``(perm, blank_idx)`` for every solvable 3×3 layout, in
+    lexicographic order.
+
+    Permutations are built digit by digit from their Lehmer code, whose
+    digit sum gives the parity of the full permutation for free.  The
+    blank sorts below every tile, so the tile-only inversion count is
+    that parity minus the blank's index — no per-layout solvability
+    check or ``index(0)`` scan is needed.  At the last two cells exactly
+    one order of two tiles is solvable; if one of them is the blank both
+    orders are (or neither is).
+    """
+
+    def rec(
+        prefix: tuple[int, ...], rest: tuple[int, ...], parity: int, blank: int
+    ) -> Iterator[tuple[tuple[int, ...], int]]:
+        if len(rest) == 2:
+            a, b = rest
+            k = len(prefix)
+            if a:
+                # (a, b) adds Lehmer digits 0, 0; (b, a) flips the parity.
+                if (parity ^ blank) & 1 == 0:
+                    yield prefix + (a, b), blank
+                else:
+                    yield prefix + (b, a), blank
+            elif (parity ^ k) & 1 == 0:
+                yield prefix + (a, b), k
+                yield prefix + (b, a), k + 1
+            return
+        for d, v in enumerate(rest):
+            yield from rec(
+                prefix + (v,),
+                rest[:d] + rest[d + 1 :],
+                parity ^ (d & 1),
+                blank if v else len(prefix),
+            )
+
+    yield from rec((), tuple(range(9)), 0, -1)
+
+
 def _generate_all_3x3() -> list[Board]:
     """Enumerate every solvable, non-trivial 3×3 permutation.
 
-    9! = 362,880 total permutations.  Exactly half (181,440) are solvable.
-    We exclude the already-solved identity (solver returns [] for it).
-    Result: 181,439 boards.
+    9! = 362,880 total permutations.  Exactly half (181,440) are solvable
+    and only those are generated.  We exclude the already-solved identity
+    (solver returns [] for it).  Result: 181,439 boards.
     """
     n = 3
     solved = tuple(range(1, n * n)) + (0,)  # (1,2,3,4,5,6,7,8,0)
     boards: list[Board] = []
-    for perm in itertools.permutations(range(n * n)):
+    for perm, blank_idx in _iter_solvable_3x3_perms():
         if perm == solved:
             continue  # skip identity — nothing to solve
         tiles = [list(perm[r * n : r * n + n]) for r in range(n)]
-        bp = divmod(perm.index(0), n)
-        board = Board(size=n, tiles=tiles, blank_pos=bp)
-        if _is_solvable(board):
-            boards.append(board)
+        boards.append(Board(size=n, tiles=tiles, blank_pos=divmod(blank_idx, n)))
     return boards
 
 
@@ -125,7 +168,7 @@ def _generate_all_3x3() -> list[Board]:
 
 
 def _generate_random_boards(
-    size: int, count: int, seen: set[str]
+    size: int, count: int, seen: set[bytes]
 ) -> list[Board]:
     boards: list[Board] = []
     while len(boards) < count:
@@ -141,39 +184,6 @@ def _generate_random_boards(
 
 # -- edge-case generation (corner swaps) --------------------------------------
 
-_FIX_PAIRS: dict[str, str] = {
-    "TL": "BR",
-    "TR": "BL",
-    "BL": "TR",
-    "BR": "TL",
-}
-
-
-def _swap_positions(
-    corner: str, direction: str, n: int
-) -> tuple[tuple[int, int], tuple[int, int]]:
-    if corner == "TL":
-        return ((0, 0), (0, 1)) if direction == "H" else ((0, 0), (1, 0))
-    if corner == "TR":
-        return ((0, n - 2), (0, n - 1)) if direction == "H" else ((0, n - 1), (1, n - 1))
-    if corner == "BL":
-        return ((n - 1, 0), (n - 1, 1)) if direction == "H" else ((n - 2, 0), (n - 1, 0))
-    # BR — blank sits at (n-1, n-1), swap tiles 2-3 cells away
-    return ((n - 1, n - 3), (n - 1, n - 2)) if direction == "H" else ((n - 3, n - 1), (n - 2, n - 1))
-
-
-def _fix_swap_positions(
-    opposite_corner: str, n: int
-) -> tuple[tuple[int, int], tuple[int, int]]:
-    if opposite_corner == "TL":
-        return (0, 0), (0, 1)
-    if opposite_corner == "TR":
-        return (0, n - 2), (0, n - 1)
-    if opposite_corner == "BL":
-        return (n - 1, 0), (n - 1, 1)
-    return (n - 2, n - 2), (n - 2, n - 1)
-
-
 def _apply_swap(board: Board, p1: tuple[int, int], p2: tuple[int, int]) -> None:
     r1, c1 = p1
     r2, c2 = p2
@@ -183,22 +193,18 @@ def _apply_swap(board: Board, p1: tuple[int, int], p2: tuple[int, int]) -> None:
     )
 
 
-def _generate_edge_cases_for_size(size: int, seen: set[str]) -> list[Board]:
+def _generate_edge_cases_for_size(size: int, seen: set[bytes]) -> list[Board]:
     """Return corner-swap boards for one difficulty level."""
     n = size
     boards: list[Board] = []
     for corner in ("TL", "TR", "BL", "BR"):
         for direction in ("H", "V"):
             board = GameGenerator.solved(n)
-            p1, p2 = _swap_positions(corner, direction, n)
+            p1, p2 = swap_positions(corner, direction, n)
             _apply_swap(board, p1, p2)
 
             if not _is_solvable(board):
-                opp = _FIX_PAIRS[corner]
-                fp1, fp2 = _fix_swap_positions(opp, n)
-                if {fp1, fp2} & {p1, p2}:
-                    mid = n // 2
-                    fp1, fp2 = (mid, 0), (mid, 1)
+                fp1, fp2 = fix_for(corner, direction, n)
                 _apply_swap(board, fp1, fp2)
                 assert _is_solvable(board), f"Parity fix failed: {size} {corner}_{direction}"
 
@@ -213,60 +219,77 @@ def _generate_edge_cases_for_size(size: int, seen: set[str]) -> list[Board]:
     return boards
 
 
+# -- per-size generation (runs in a worker process) ---------------------------
+
+
+def _generate_size(label: str, size: int) -> tuple[list[Board], int, int]:
+    """Build the shuffled random + edge-case boards for one larger size.
+
+    Each size seeds its own RNG from ``SEED`` and *size*, so output is
+    reproducible regardless of which worker runs it or in what order.
+    Returns the boards, the number of edge-case boards among them, and
+    the number of unique hashes seen.
+    """
+    rng = GameGenerator.seed(SEED * 1000 + size)
+    seen: set[bytes] = set()
+
+    # 1. Random boards
+    random_boards = _generate_random_boards(size, RANDOM_BOARD_COUNTS[label], seen)
+
+    # 2. Edge-case boards (corner swaps)
+    edge_boards = _generate_edge_cases_for_size(size, seen)
+
+    # 3. Merge & shuffle so edge cases are indistinguishable
+    all_boards = random_boards + edge_boards
+    rng.shuffle(all_boards)
+    return all_boards, len(edge_boards), len(seen)
+
+
 # -- main ---------------------------------------------------------------------
 
 
 def main() -> None:
     FIXTURES_DIR.mkdir(parents=True, exist_ok=True)
-    random.seed(SEED)
-
-    # ---- 3×3: exhaustive (every solvable permutation) -----------------------
-    print("Generating ALL solvable 3×3 permutations (9!/2 − 1) …")
-    all_3x3 = _generate_all_3x3()
-    random.shuffle(all_3x3)
-    entries_3x3 = [
-        _board_to_dict(b, f"board_3x3_{i:06d}")
-        for i, b in enumerate(all_3x3)
-    ]
-    path_3x3 = FIXTURES_DIR / "3x3.json"
-    with open(path_3x3, "w") as f:
-        json.dump(entries_3x3, f, separators=(",", ":"))
-    print(f"  → 3x3.json  ({len(entries_3x3)} boards — exhaustive) ✓")
-
-    # ---- 7×7, 10×10, 12×12: random + edge cases ----------------------------
-    for label, size in DIFFICULTIES.items():
-        if label == "3x3":
-            continue  # already handled above
-
-        seen: set[str] = set()
-        count = RANDOM_BOARD_COUNTS[label]
-
-        # 1. Random boards
-        print(f"Generating {count} random {label} boards …")
-        random_boards = _generate_random_boards(size, count, seen)
-
-        # 2. Edge-case boards (corner swaps)
-        edge_boards = _generate_edge_cases_for_size(size, seen)
-        print(f"  + {len(edge_boards)} edge-case boards")
-
-        # 3. Merge & shuffle so edge cases are indistinguishable
-        all_boards = random_boards + edge_boards
-        random.shuffle(all_boards)
-
-        # 4. Assign uniform sequential IDs
-        entries = [
-            _board_to_dict(b, f"board_{label}_{i:04d}")
-            for i, b in enumerate(all_boards)
-        ]
-
-        # 5. Write
-        path = FIXTURES_DIR / f"{label}.json"
-        with open(path, "w") as f:
-            json.dump(entries, f, separators=(",", ":"))
-
-        total = len(entries)
-        unique = len(seen)
-        print(f"  → {path.name}  ({total} boards, {unique} unique hashes) ✓")
+    rng = GameGenerator.seed(SEED)
+
+    # The larger sizes are independent of each other and of the 3×3 pass,
+    # so they are generated in worker processes while 3×3 runs here.
+    sizes = {label: size for label, size in DIFFICULTIES.items() if label != "3x3"}
+    with ProcessPoolExecutor(max_workers=len(sizes)) as pool:
+        futures = {
+            label: pool.submit(_generate_size, label, size)
+            for label, size in sizes.items()
+        }
+
+        # ---- 3×3: exhaustive (every solvable permutation) -------------------
+        print("Generating ALL solvable 3×3 permutations (9!/2 − 1) …")
+        all_3x3 = _generate_all_3x3()
+        rng.shuffle(all_3x3)
+        total_3x3 = write_entries(
+            FIXTURES_DIR / "3x3.json",
+            (
+                _board_to_dict(b, f"board_3x3_{i:06d}")
+                for i, b in enumerate(all_3x3)
+            ),
+        )
+        print(f"  → 3x3.json  ({total_3x3} boards — exhaustive) ✓")
+
+        # ---- 7×7, 10×10, 12×12: random + edge cases ------------------------
+        for label, future in futures.items():
+            print(f"Generating {RANDOM_BOARD_COUNTS[label]} random {label} boards …")
+            all_boards, edge_count, unique = future.result()
+            print(f"  + {edge_count} edge-case boards")
+
+            # 4. Assign uniform sequential IDs and write
+            path = FIXTURES_DIR / f"{label}.json"
+            total = write_entries(
+                path,
+                (
+                    _board_to_dict(b, f"board_{label}_{i:04d}")
+                    for i, b in enumerate(all_boards)
+                ),
+            )
+            print(f"  → {path.name}  ({total} boards, {unique} unique hashes) ✓")
 
     print("Done!")
 
@@ -3,13 +3,53 @@
 from __future__ import annotations
 
 import random
+from functools import cache
 
 from backend.models.board import Board
 
+_Pos = tuple[int, int]
+
+# Private RNG: bound-method calls on an instance skip the module-level
+# ``random.*`` indirection, and seeding it does not touch global state.
+_RNG = random.Random()
+
+# Blank step offsets, in the order scramble draws from.
+_STEPS: tuple[_Pos, ...] = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+@cache
+def _move_table(size: int) -> dict[tuple[_Pos, _Pos | None], tuple[_Pos, ...]]:
+    """Legal blank targets keyed by ``(blank_pos, prev_pos)``.
+
+    Built once per size.  Each entry already excludes the cell the blank
+    just left (unless it is the only option), in the same order as
+    ``GameGenerator._neighbors_of``.
+    """
+    table: dict[tuple[_Pos, _Pos | None], tuple[_Pos, ...]] = {}
+    for r in range(size):
+        for c in range(size):
+            pos = (r, c)
+            neighbors = GameGenerator._neighbors_of(pos, size)
+            table[pos, None] = tuple(neighbors)
+            for prev in neighbors:
+                rest = tuple(x for x in neighbors if x != prev)
+                table[pos, prev] = rest or (prev,)
+    return table
+
 
 class GameGenerator:
     """Creates solvable puzzles by shuffling from the solved state."""
 
+    @staticmethod
+    def seed(value: int | None = None) -> random.Random:
+        """Re-seed the generator's RNG and return it.
+
+        Callers that need reproducible output (e.g. the fixture scripts)
+        can draw from the returned RNG to stay on the same stream.
+        """
+        _RNG.seed(value)
+        return _RNG
+
     @staticmethod
     def solved(size: int) -> Board:
         """Return the goal-state board (all tiles in order, blank bottom-right)."""
@@ -30,13 +70,12 @@ class GameGenerator:
     def scramble(board: Board) -> None:
         """Scramble *board* in-place using random valid moves."""
         num_shuffles = board.size * board.size * 100
+        table = _move_table(board.size)
+        choice = _RNG.choice
         prev_pos: tuple[int, int] | None = None
 
         for _ in range(num_shuffles):
-            neighbors = GameGenerator._get_neighbors(board)
-            if prev_pos in neighbors and len(neighbors) > 1:
-                neighbors.remove(prev_pos)
-            target = random.choice(neighbors)
+            target = choice(table[board.blank_pos, prev_pos])
             prev_pos = board.blank_pos
             GameGenerator._swap(board, target)
 
@@ -55,12 +94,12 @@ class GameGenerator:
     # -- helpers --------------------------------------------------------------
 
     @staticmethod
-    def _get_neighbors(board: Board) -> list[tuple[int, int]]:
-        br, bc = board.blank_pos
+    def _neighbors_of(pos: tuple[int, int], size: int) -> list[tuple[int, int]]:
+        br, bc = pos
         neighbors: list[tuple[int, int]] = []
-        for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+        for dr, dc in _STEPS:
             nr, nc = br + dr, bc + dc
-            if 0 <= nr < board.size and 0 <= nc < board.size:
+            if 0 <= nr < size and 0 <= nc < size:
                 neighbors.append((nr, nc))
         return neighbors
 
@@ -68,8 +107,8 @@ class GameGenerator:
     def _swap(board: Board, target: tuple[int, int]) -> None:
         br, bc = board.blank_pos
         tr, tc = target
-        board.tiles[br][bc], board.tiles[tr][tc] = (
-            board.tiles[tr][tc],
-            board.tiles[br][bc],
-        )
-        board.blank_pos = (tr, tc)
+        tiles = board.tiles
+        # The blank is always 0, so write it last — no temporary tuple.
+        tiles[br][bc] = tiles[tr][tc]
+        tiles[tr][tc] = 0
+        board.blank_pos = target
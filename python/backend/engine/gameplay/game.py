@@ -6,6 +6,18 @@ from backend.engine.gamegenerator import GameGenerator
 from backend.engine.gamestate import GameState
 from backend.models.board import Board, Direction
 
+# The offset points to the tile that will slide into the blank.
+# UP   → tile at (br+1, bc) moves up   → blank shifts down
+# DOWN → tile at (br-1, bc) moves down  → blank shifts up
+# LEFT → tile at (br, bc+1) moves left  → blank shifts right
+# RIGHT→ tile at (br, bc-1) moves right → blank shifts left
+_OFFSETS: dict[Direction, tuple[int, int]] = {
+    Direction.UP: (1, 0),
+    Direction.DOWN: (-1, 0),
+    Direction.LEFT: (0, 1),
+    Direction.RIGHT: (0, -1),
+}
+
 
 class GamePlay:
     """Orchestrates a single game session."""
@@ -33,19 +45,7 @@ class GamePlay:
         """
         board = self.state.board
         br, bc = board.blank_pos
-
-        # The offset points to the tile that will slide into the blank.
-        # UP   → tile at (br+1, bc) moves up   → blank shifts down
-        # DOWN → tile at (br-1, bc) moves down  → blank shifts up
-        # LEFT → tile at (br, bc+1) moves left  → blank shifts right
-        # RIGHT→ tile at (br, bc-1) moves right → blank shifts left
-        offsets = {
-            Direction.UP: (1, 0),
-            Direction.DOWN: (-1, 0),
-            Direction.LEFT: (0, 1),
-            Direction.RIGHT: (0, -1),
-        }
-        dr, dc = offsets[direction]
+        dr, dc = _OFFSETS[direction]
         tr, tc = br + dr, bc + dc
 
         if not (0 <= tr < board.size and 0 <= tc < board.size):
@@ -83,8 +83,8 @@ class GamePlay:
     def _swap(board: Board, target: tuple[int, int]) -> None:
         br, bc = board.blank_pos
         tr, tc = target
-        board.tiles[br][bc], board.tiles[tr][tc] = (
-            board.tiles[tr][tc],
-            board.tiles[br][bc],
-        )
-        board.blank_pos = (tr, tc)
+        tiles = board.tiles
+        # The blank is always 0, so write it last — no temporary tuple.
+        tiles[br][bc] = tiles[tr][tc]
+        tiles[tr][tc] = 0
+        board.blank_pos = target
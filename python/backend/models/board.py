@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import StrEnum
+from functools import cache
+from itertools import chain
 
 
 class Direction(StrEnum):
@@ -13,6 +15,22 @@ class Direction(StrEnum):
     RIGHT = "right"
 
 
+@cache
+def _goal_rows(size: int) -> tuple[tuple[int, ...], ...]:
+    """Goal layout for *size*, one tuple per row (immutable, so shareable)."""
+    rows = [tuple(range(r * size + 1, r * size + size + 1)) for r in range(size)]
+    rows[-1] = rows[-1][:-1] + (0,)
+    return tuple(rows)
+
+
+@cache
+def _goal_cells(size: int) -> tuple[tuple[int, int], ...]:
+    """Goal ``(row, col)`` of each tile value; index 0 is the blank."""
+    return ((size - 1, size - 1),) + tuple(
+        divmod(v, size) for v in range(size * size - 1)
+    )
+
+
 @dataclass
 class Board:
     """Represents the sliding puzzle board.
@@ -54,26 +72,44 @@ class Board:
     def get_tile(self, row: int, col: int) -> int:
         return self.tiles[row][col]
 
+    def flat(self) -> list[int]:
+        """Return the tiles as a new flat row-major list."""
+        return list(chain.from_iterable(self.tiles))
+
+    @property
+    def blank_index(self) -> int:
+        """Row-major index of the blank (``r * size + c``)."""
+        return self.blank_pos[0] * self.size + self.blank_pos[1]
+
     def is_solved(self) -> bool:
         """Check if all tiles are in their goal positions."""
-        expected = 1
-        for r in range(self.size):
-            for c in range(self.size):
-                if r == self.size - 1 and c == self.size - 1:
-                    return self.tiles[r][c] == 0
-                if self.tiles[r][c] != expected:
-                    return False
-                expected += 1
-        return True
+        last = self.size - 1
+        if self.blank_pos != (last, last):
+            return False  # cheap reject: true for almost every scrambled board
+        # Row by row, stopping at the first row that differs.
+        return all(
+            tuple(row) == goal
+            for row, goal in zip(self.tiles, _goal_rows(self.size))
+        )
 
     def is_tile_correct(self, row: int, col: int) -> bool:
         """Check if a specific tile is in its goal position."""
-        val = self.tiles[row][col]
-        if val == 0:
-            return row == self.size - 1 and col == self.size - 1
-        expected_row = (val - 1) // self.size
-        expected_col = (val - 1) % self.size
-        return row == expected_row and col == expected_col
+        return _goal_cells(self.size)[self.tiles[row][col]] == (row, col)
+
+    def correctness_mask(self) -> int:
+        """Bitmask of tiles in their goal positions.
+
+        Bit ``r * size + c`` is set iff ``is_tile_correct(r, c)`` — one
+        pass for the whole board instead of a call per cell.
+        """
+        last = self.size * self.size - 1
+        mask = 0
+        for i, v in enumerate(chain.from_iterable(self.tiles)):
+            if v == i + 1:
+                mask |= 1 << i
+        if self.blank_index == last:  # the blank's goal is the last cell
+            mask |= 1 << last
+        return mask
 
     def copy(self) -> Board:
         return Board(
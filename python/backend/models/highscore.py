@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import os
+from bisect import insort
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -10,50 +12,106 @@ from pathlib import Path
 @dataclass
 class HighScoreEntry:
     moves: int
-    time: float
+    time_ms: int  # whole milliseconds; ints keep ranking and JSON exact
     date: str
 
+    @property
+    def time(self) -> float:
+        """Elapsed time in seconds."""
+        return self.time_ms / 1000
+
+    @classmethod
+    def from_dict(cls, data: dict) -> HighScoreEntry:
+        """Build an entry from its JSON form (either storage format)."""
+        if "time_ms" in data:
+            time_ms = data["time_ms"]
+        else:
+            # Files written before millisecond storage hold float seconds.
+            time_ms = round(data["time"] * 1000)
+        return cls(moves=data["moves"], time_ms=time_ms, date=data["date"])
+
+
+def _rank(e: HighScoreEntry) -> tuple[int, int]:
+    """Sort key: fewest moves first, then fastest time."""
+    return (e.moves, e.time_ms)
+
+
+def _stamp(path: Path) -> tuple[int, int, int]:
+    """Identify one version of *path*; save() swaps in a new inode each time."""
+    st = path.stat()
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
 
 class HighScoreManager:
     """Loads, saves, and queries high scores from a JSON file."""
 
     def __init__(self, filepath: Path) -> None:
         self.filepath = filepath
-        self._scores: dict[str, list[HighScoreEntry]] = {}
+        # In-memory copy of the file, keyed by board size; every query is
+        # served from here and add_score writes through to disk.
+        self._scores: dict[int, list[HighScoreEntry]] = {}
+        self._stamp: tuple[int, int, int] | None = None
+        self._version = 0
         self._load()
 
     # -- persistence ----------------------------------------------------------
 
     def _load(self) -> None:
-        if self.filepath.exists():
-            data = json.loads(self.filepath.read_text())
-            for size_key, entries in data.items():
-                self._scores[size_key] = [
-                    HighScoreEntry(**e) for e in entries
-                ]
+        try:
+            stamp = _stamp(self.filepath)
+        except FileNotFoundError:
+            if self._stamp is not None:
+                # The file we had loaded was deleted: drop its scores.
+                self._stamp = None
+                self._scores = {}
+                self._version += 1
+            return
+        if stamp == self._stamp:
+            return  # unchanged since we last read or wrote it
+        self._stamp = stamp
+        data = json.loads(self.filepath.read_text())
+        self._scores = {}
+        for size_key, entries in data.items():
+            # Keep each list sorted so add_score can insert in place.
+            self._scores[int(size_key)] = sorted(
+                (HighScoreEntry.from_dict(e) for e in entries), key=_rank
+            )
+        self._version += 1
+
+    def reload(self) -> None:
+        """Re-read the file if it was replaced, changed or removed since last access."""
+        self._load()
 
     def save(self) -> None:
         self.filepath.parent.mkdir(parents=True, exist_ok=True)
         data: dict[str, list[dict]] = {}
-        for size_key, entries in self._scores.items():
-            data[size_key] = [
-                {"moves": e.moves, "time": e.time, "date": e.date}
+        for size, entries in self._scores.items():
+            data[str(size)] = [
+                {"moves": e.moves, "time_ms": e.time_ms, "date": e.date}
                 for e in entries
             ]
-        self.filepath.write_text(json.dumps(data, indent=2) + "\n")
+        # Write to a sibling temp file and swap it in, so a crash mid-write
+        # never leaves a truncated scores file behind.
+        tmp = self.filepath.with_name(self.filepath.name + ".tmp")
+        tmp.write_text(json.dumps(data, indent=2) + "\n")
+        os.replace(tmp, self.filepath)
+        self._stamp = _stamp(self.filepath)
 
     # -- queries --------------------------------------------------------------
 
+    @property
+    def version(self) -> int:
+        """Bumped whenever the scores change; lets callers cache renderings."""
+        return self._version
+
     def add_score(self, size: int, entry: HighScoreEntry) -> None:
-        key = str(size)
-        if key not in self._scores:
-            self._scores[key] = []
-        self._scores[key].append(entry)
-        self._scores[key].sort(key=lambda e: (e.moves, e.time))
+        # insort places ties after existing entries, like the stable sort did.
+        insort(self._scores.setdefault(size, []), entry, key=_rank)
+        self._version += 1
         self.save()
 
     def get_scores(self, size: int) -> list[HighScoreEntry]:
-        return self._scores.get(str(size), [])
+        return self._scores.get(size, [])
 
     def get_all_sizes(self) -> list[int]:
-        return sorted(int(k) for k in self._scores)
+        return sorted(self._scores)
@@ -8,15 +8,20 @@ from __future__ import annotations
 
 import os
 import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+if os.name != "nt":
+    import select
+    import selectors
+    import termios
+    import tty
 
 
 # -- low-level character readers -----------------------------------------------
 
 
 def _getch_unix() -> str:
-    import termios
-    import tty
-
     fd = sys.stdin.fileno()
     old = termios.tcgetattr(fd)
     try:
@@ -72,8 +77,18 @@ _ARROW_MAP: dict[str, str] = {
 }
 
 
+# Every mapped key is ASCII, so resolve that range with a flat table
+# indexed by code point instead of a dict lookup + isprintable().
+_KEY_TABLE: tuple[str, ...] = tuple(
+    _KEY_MAP.get(chr(i), chr(i) if chr(i).isprintable() else "")
+    for i in range(128)
+)
+
+
 def _resolve(ch: str) -> str:
     """Map a raw character to its action string."""
+    if len(ch) == 1 and ord(ch) < 128:
+        return _KEY_TABLE[ord(ch)]
     return _KEY_MAP.get(ch, ch if ch.isprintable() else "")
 
 
@@ -97,6 +112,7 @@ def get_key() -> str:
         "<char>"                       — unmapped printable char
         ""                             — unrecognised key
     """
+    sys.stdout.flush()  # show any pending frame before blocking
     ch = _getch()
 
     # Arrow keys (Unix escape sequences: ESC [ A/B/C/D)
@@ -110,6 +126,79 @@ def get_key() -> str:
     return _resolve(ch)
 
 
+@contextmanager
+def raw_mode(fd: int) -> Iterator[None]:
+    """Put terminal *fd* into raw input mode for the duration of the block.
+
+    Output post-processing stays on so ``print`` still maps ``\n`` to
+    CR-LF while rendering.  No-op on Windows.
+    """
+    if os.name == "nt":
+        yield
+        return
+    old = termios.tcgetattr(fd)
+    try:
+        tty.setraw(fd)
+        mode = termios.tcgetattr(fd)
+        mode[1] |= termios.OPOST
+        termios.tcsetattr(fd, termios.TCSADRAIN, mode)
+        yield
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old)
+
+
+# One persistent selector per fd: registration happens once, and each poll
+# is an epoll/kqueue wait instead of rebuilding a select() fd set.
+_SELECTORS: dict[int, selectors.BaseSelector] = {}
+
+
+def _readable(fd: int, timeout: float) -> bool:
+    """Wait up to *timeout* seconds for *fd* to have input."""
+    sel = _SELECTORS.get(fd)
+    if sel is None:
+        sel = selectors.DefaultSelector()
+        try:
+            sel.register(fd, selectors.EVENT_READ)
+        except (OSError, ValueError):
+            # e.g. epoll refuses regular files — plain select() still works.
+            sel.close()
+            return bool(select.select([fd], [], [], timeout)[0])
+        _SELECTORS[fd] = sel
+    return bool(sel.select(timeout))
+
+
+def get_key_timeout_raw(fd: int, timeout: float) -> str | None:
+    """Like ``get_key_timeout`` but assumes *fd* is already in raw mode.
+
+    Use inside ``raw_mode`` to poll repeatedly without re-configuring the
+    terminal each call — each poll is then just ``select`` + ``os.read``.
+    """
+    if os.name == "nt":
+        return get_key_timeout(timeout)
+
+    sys.stdout.flush()  # show any pending frame before blocking
+    if not _readable(fd, timeout):
+        return None
+
+    # Use os.read (unbuffered) so subsequent select() calls see
+    # remaining bytes of multi-byte sequences (e.g. arrow keys).
+    ch = os.read(fd, 1).decode("utf-8", errors="ignore")
+
+    # Arrow keys: ESC [ A/B/C/D
+    if ch == "\x1b":
+        if _readable(fd, 0.1):
+            ch2 = os.read(fd, 1).decode("utf-8", errors="ignore")
+            if ch2 == "[":
+                if _readable(fd, 0.1):
+                    ch3 = os.read(fd, 1).decode("utf-8", errors="ignore")
+                    return _ARROW_MAP.get(ch3, "")
+                return ""
+            return "quit"
+        return "quit"  # bare Escape
+
+    return _resolve(ch)
+
+
 def get_key_timeout(timeout: float) -> str | None:
     """Read a single keypress with a timeout.
 
@@ -124,6 +213,7 @@ def get_key_timeout(timeout: float) -> str | None:
         import msvcrt  # type: ignore[import-not-found]
         import time as _time
 
+        sys.stdout.flush()  # show any pending frame before blocking
         end = _time.monotonic() + timeout
         while _time.monotonic() < end:
             if msvcrt.kbhit():
@@ -131,36 +221,6 @@ def get_key_timeout(timeout: float) -> str | None:
             _time.sleep(0.02)
         return None
 
-    import select
-    import termios
-    import tty
-
     fd = sys.stdin.fileno()
-    old = termios.tcgetattr(fd)
-    try:
-        tty.setraw(fd)
-        ready, _, _ = select.select([fd], [], [], timeout)
-        if not ready:
-            return None
-
-        # Use os.read (unbuffered) so subsequent select() calls see
-        # remaining bytes of multi-byte sequences (e.g. arrow keys).
-        ch = os.read(fd, 1).decode("utf-8", errors="ignore")
-
-        # Arrow keys: ESC [ A/B/C/D
-        if ch == "\x1b":
-            r2, _, _ = select.select([fd], [], [], 0.1)
-            if r2:
-                ch2 = os.read(fd, 1).decode("utf-8", errors="ignore")
-                if ch2 == "[":
-                    r3, _, _ = select.select([fd], [], [], 0.1)
-                    if r3:
-                        ch3 = os.read(fd, 1).decode("utf-8", errors="ignore")
-                        return _ARROW_MAP.get(ch3, "")
-                    return ""
-                return "quit"
-            return "quit"  # bare Escape
-
-        return _resolve(ch)
-    finally:
-        termios.tcsetattr(fd, termios.TCSADRAIN, old)
+    with raw_mode(fd):
+        return get_key_timeout_raw(fd, timeout)
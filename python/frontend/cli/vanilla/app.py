@@ -6,9 +6,14 @@ Includes a built-in menu for size selection, play, study, and high scores.
 
 from __future__ import annotations
 
+import io
+import shutil
+import signal
 import sys
 import time
-from datetime import datetime
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import cache, lru_cache
 from pathlib import Path
 
 from backend.engine.gamegenerator import GameGenerator
@@ -16,7 +21,7 @@ from backend.engine.gameplay import GamePlay
 from backend.engine.gamesolver import Solver
 from backend.models.board import Board, Direction
 from backend.models.highscore import HighScoreEntry, HighScoreManager
-from frontend.cli.input_handler import get_key, get_key_timeout
+from frontend.cli.input_handler import get_key, get_key_timeout_raw, raw_mode
 
 
 # -- ANSI helpers -------------------------------------------------------------
@@ -29,9 +34,29 @@ _BOLD = "\033[1m"    # bold
 _R = "\033[0m"       # reset
 _BG_SEL = "\033[42;30m"  # green bg, black fg (selected size)
 
+# Action string (from input_handler) → tile move direction.
+_DIRECTION_MAP: dict[str, Direction] = {
+    "up": Direction.UP,
+    "down": Direction.DOWN,
+    "left": Direction.LEFT,
+    "right": Direction.RIGHT,
+}
+
 
 def _clear() -> None:
-    sys.stdout.write("\033[2J\033[H")
+    # Home + erase-below rather than a full-screen clear: from the top-left
+    # it blanks the same area, but terminals repaint far less (no flicker,
+    # no scrollback churn).
+    # Not flushed: the clear goes out together with the frame that follows.
+    global _last_frame
+    _last_frame = None
+    _refresh_rows()
+    sys.stdout.write("\033[H\033[J")
+
+
+def _emit(parts: list[str]) -> None:
+    """Write a whole frame in one call and flush it."""
+    sys.stdout.write("".join(parts))
     sys.stdout.flush()
 
 
@@ -40,58 +65,119 @@ def _format_time(seconds: float) -> str:
     return f"{m}:{s:02d}" if m else f"{s}s"
 
 
+def _until_next_tick(game: GamePlay) -> float:
+    """Seconds until the displayed (whole-second) time next changes."""
+    # Small margin so we wake just after the boundary, not just before.
+    return 1.0 - game.state.elapsed_time % 1.0 + 0.01
+
+
+# Stats line template; the in-place variant returns to column 0 and clears
+# the line first, so each clock tick is a single write.
+_STATS_FMT = f"  Moves: {_Y}%d{_R}  |  Time: {_Y}%s{_R}"
+_STATS_UPDATE_FMT = "\r\033[K" + _STATS_FMT
+
+
 def _stats_line(game: GamePlay) -> str:
     """Return the formatted Moves + Time string (no newline)."""
-    return (
-        f"  Moves: {_Y}{game.state.moves}{_R}  |  "
-        f"Time: {_Y}{_format_time(game.state.elapsed_time)}{_R}"
-    )
+    return _STATS_FMT % (game.state.moves, _format_time(game.state.elapsed_time))
 
 
 # -- board rendering ----------------------------------------------------------
 
 
+@cache
+def _geometry(size: int) -> tuple[int, str]:
+    """Number width and row separator for a *size* board."""
+    width = len(str(size * size - 1))  # widest number
+    cell_w = width + 2  # padding
+    return width, "+" + (("-" * cell_w + "+") * size)
+
+
+@cache
+def _cell_table(size: int) -> tuple[str, ...]:
+    """Every formatted cell string for a *size* board, indexed by state.
+
+    ``table[val]`` is tile *val* out of place (0 is the blank) and
+    ``table[n² + val]`` is the same tile in its goal cell, so rendering a
+    cell is one tuple index: ``table[val + n² * (val == index + 1)]``.
+    """
+    width = _geometry(size)[0]
+    n2 = size * size
+    plain = [f"{_DIM} {'·':>{width}} {_R}"]
+    plain += [f" {val:>{width}} " for val in range(1, n2)]
+    correct = [plain[0]]  # the blank is never "correct"
+    correct += [f"{_G} {val:>{width}} {_R}" for val in range(1, n2)]
+    return tuple(plain + correct)
+
+
 def _render_board(board: Board) -> str:
     """Return an ANSI-coloured text representation of the board."""
-    width = len(str(board.size * board.size - 1))  # widest number
-    cell_w = width + 2  # padding
-    sep = "+" + (("-" * cell_w + "+") * board.size)
-
-    lines: list[str] = [sep]
-    for r, row in enumerate(board.tiles):
-        cells: list[str] = []
-        for c, val in enumerate(row):
-            if val == 0:
-                cells.append(f"{_DIM} {'·':>{width}} {_R}")
-            elif board.is_tile_correct(r, c):
-                cells.append(f"{_G} {val:>{width}} {_R}")
-            else:
-                cells.append(f" {val:>{width}} ")
-        lines.append("|" + "|".join(cells) + "|")
-        lines.append(sep)
-    return "\n".join(lines)
+    return _render_tiles(board.size, tuple(board.flat()))
+
+
+@lru_cache(maxsize=128)
+def _render_tiles(size: int, flat: tuple[int, ...]) -> str:
+    """Render a row-major tile layout.
+
+    Cached, so re-drawing an unchanged board (status refreshes, failed
+    moves) skips the work entirely.
+    """
+    sep = _geometry(size)[1]
+    table = _cell_table(size)
+    n2 = size * size
+
+    # One pass over the flat layout; a tile is correct when it sits at
+    # index value - 1 (never true for the blank).
+    cells = [table[val + n2 * (val == i + 1)] for i, val in enumerate(flat)]
+
+    rows = [
+        "|" + "|".join(cells[base : base + size]) + "|"
+        for base in range(0, size * size, size)
+    ]
+    between = f"\n{sep}\n"
+    return f"{sep}\n{between.join(rows)}\n{sep}"
 
 
 # -- solver helpers -----------------------------------------------------------
 
 
+# The solver is a pure function of the tile layout, so results are cached
+# by (size, flat tiles) — repeated hints/solves on a position are free.
+
+
+@lru_cache(maxsize=1024)
+def _cached_hint(size: int, flat: tuple[int, ...]) -> Direction | None:
+    return Solver.hint(Board.from_flat(size, list(flat)))
+
+
+@lru_cache(maxsize=32)
+def _cached_solve(size: int, flat: tuple[int, ...]) -> tuple[Direction, ...]:
+    return tuple(Solver.solve(Board.from_flat(size, list(flat))))
+
+
+# One status line per direction, built once rather than per hint.
+_HINT_STATUS: dict[Direction, str] = {
+    d: f"{_C}Hint:{_R} moved {_BOLD}{d.value}{_R}" for d in Direction
+}
+
+
 def _apply_hint(game: GamePlay) -> str:
     """Apply a single solver hint.  Returns a status message."""
     board = game.state.board
-    hint = Solver.hint(board)
+    hint = _cached_hint(board.size, tuple(board.flat()))
     if hint is None:
         if board.is_solved():
             return f"{_G}Already solved!{_R}"
         return f"{_Y}No hint available (unsolvable or solver not implemented).{_R}"
     game.move(hint)
-    return f"{_C}Hint:{_R} moved {_BOLD}{hint.value}{_R}"
+    return _HINT_STATUS[hint]
 
 
 def _auto_solve(game: GamePlay) -> str:
     """Run the solver and animate moves.  Returns a status message."""
     board = game.state.board
     try:
-        moves = Solver.solve(board)
+        moves = _cached_solve(board.size, tuple(board.flat()))
     except NotImplementedError:
         return f"{_Y}Solver not yet implemented.{_R}"
 
@@ -100,17 +186,31 @@ def _auto_solve(game: GamePlay) -> str:
             return f"{_G}Already solved!{_R}"
         return "Board is unsolvable."
 
+    # Fixed 20 fps: sleep only for what is left of each frame's budget, so
+    # slow renders on large boards don't stretch the playback.
+    # After the first full frame each step only rewrites the two cells
+    # that swapped and the progress line just above the cursor.
+    size = game.size
+    shown: tuple[int, ...] | None = None
+    deadline = time.perf_counter()
     for i, direction in enumerate(moves):
         game.move(direction)
-        _clear()
-        size = game.size
-        print(f"  {_C}=== Solving\u2026 ({size}\u00d7{size}) ==={_R}")
-        print()
-        print(_render_board(game.state.board))
-        print()
-        print(f"  Move {i + 1}/{len(moves)}  ({direction.value})")
-        sys.stdout.flush()
-        time.sleep(0.05)
+        flat = tuple(game.state.board.flat())
+        progress = f"  Move {i + 1}/{len(moves)}  ({direction.value})\n"
+        if shown is None or not _fits(size, 4):
+            _clear()
+            _emit([
+                f"  {_C}=== Solving\u2026 ({size}\u00d7{size}) ==={_R}\n\n",
+                _render_tiles(size, flat),
+                "\n\n",
+                progress,
+            ])
+        else:
+            _patch_cells(size, shown, flat, 4)
+            _emit(["\033[A\r\033[K", progress])
+        shown = flat
+        deadline += 0.05
+        time.sleep(max(0.0, deadline - time.perf_counter()))
 
     return f"{_G}Solved in {len(moves)} moves!{_R}"
 
@@ -126,120 +226,246 @@ _DIFFICULTIES: list[tuple[str, int]] = [
 ]
 
 
-def _show_menu(sel_idx: int) -> None:
-    _clear()
-    print()
-    print(f"  {_BOLD}======================================{_R}")
-    print(f"  {_BOLD}     S L I D I N G   P U Z Z L E     {_R}")
-    print(f"  {_BOLD}======================================{_R}")
-    print()
-
-    # Difficulty selector
-    diff_str = ""
+def _difficulty_line(sel_idx: int) -> str:
+    parts = []
     for i, (label, size) in enumerate(_DIFFICULTIES):
         tag = f"{label} {size}\u00d7{size}"
         if i == sel_idx:
-            diff_str += f"  {_BG_SEL} {tag} {_R}"
+            parts.append(f"  {_BG_SEL} {tag} {_R}")
         else:
-            diff_str += f"  {_DIM}{tag}{_R}"
-    print(f"   {diff_str}")
-    print(f"    {_DIM}\u2190 \u2192 to change{_R}")
-    print()
-
+            parts.append(f"  {_DIM}{tag}{_R}")
+    return "   " + "".join(parts)
+
+
+# Only len(_DIFFICULTIES) selector states exist; index by the selection.
+_DIFFICULTY_LINES: tuple[str, ...] = tuple(
+    _difficulty_line(i) for i in range(len(_DIFFICULTIES))
+)
+
+
+# Everything above and below the difficulty selector is static.
+_MENU_HEAD = (
+    "\n"
+    f"  {_BOLD}======================================{_R}\n"
+    f"  {_BOLD}     S L I D I N G   P U Z Z L E     {_R}\n"
+    f"  {_BOLD}======================================{_R}\n"
+    "\n"
+)
+_MENU_TAIL = (
+    "\n"
+    f"    {_DIM}\u2190 \u2192 to change{_R}\n"
+    "\n"
     # Options
-    print(f"    {_C}1{_R}  Play")
-    print(f"    {_Y}2{_R}  Study")
-    print(f"    {_DIM}3{_R}  High Scores")
-    print(f"    {_DIM}Q{_R}  Quit")
-    print()
+    f"    {_C}1{_R}  Play\n"
+    f"    {_Y}2{_R}  Study\n"
+    f"    {_DIM}3{_R}  High Scores\n"
+    f"    {_DIM}Q{_R}  Quit\n"
+    "\n"
+)
+# Lines between the selector and where the cursor rests after a paint.
+_MENU_SEL_UP = _MENU_TAIL.count("\n")
+
+
+def _show_menu(sel_idx: int) -> None:
+    _clear()
+    _emit([_MENU_HEAD, _DIFFICULTY_LINES[sel_idx], _MENU_TAIL])
+
+
+def _update_menu_selection(sel_idx: int) -> None:
+    """Rewrite just the selector line of the menu already on screen."""
+    _emit([
+        f"\033[{_MENU_SEL_UP}A\r\033[2K",
+        _DIFFICULTY_LINES[sel_idx],
+        f"\033[{_MENU_SEL_UP}B\r",
+    ])
 
 
 # -- game screens -------------------------------------------------------------
 
+# Controls help lines depend only on the mode, so build them once.
+_PLAY_CONTROLS = (
+    f"  {_C}WASD{_R}/{_C}Arrows{_R}: move  |  "
+    f"{_C}N{_R}: hint  |  "
+    f"{_C}R{_R}: restart  |  "
+    f"{_C}Q{_R}: back"
+)
+_STUDY_CONTROLS = (
+    f"  {_C}WASD{_R}/{_C}Arrows{_R}: move  |  "
+    f"{_Y}R{_R}: scramble  |  "
+    f"{_C}N{_R}: hint  |  "
+    f"{_C}V{_R}: solve  |  "
+    f"{_C}Q{_R}: back"
+)
+
+# The last fully painted game/study frame: (screen key, flat tiles).  While
+# the key (mode, size, status) is unchanged, the next frame only rewrites
+# the cells that moved.  Any _clear() invalidates it.
+_last_frame: tuple[tuple[str, int, str], tuple[int, ...]] | None = None
+
+# Terminal height, re-read on every full repaint and on SIGWINCH so the
+# diff frames in between do not pay for a syscall each.
+_rows = 0
+
+
+def _refresh_rows(*_: object) -> None:
+    global _rows
+    _rows = shutil.get_terminal_size().lines
+
+
+def _fits(size: int, below: int) -> bool:
+    """Whether a frame painted from the top of the screen, with the cursor
+    *below* lines under its last board row, is still entirely on screen.
+
+    Relative cursor-up moves stop at the top edge, so once the frame has
+    scrolled the first board rows are out of reach and a full repaint is
+    needed instead of ``_patch_cells``.
+    """
+    return 2 * size + 2 + below <= _rows
+
+
+def _patch_cells(
+    size: int, old: tuple[int, ...], new: tuple[int, ...], below: int
+) -> None:
+    """Overwrite just the cells that differ between *old* and *new*.
+
+    *below* is how many lines the cursor sits under the last board row.
+    Cursor moves are relative, so this works wherever the frame ended up
+    on screen; the cursor is left at the start of its original line.
+    """
+    step = _geometry(size)[0] + 3  # cell plus its "|"
+    table = _cell_table(size)
+    n2 = size * size
+    parts: list[str] = []
+    up = 0  # lines above the starting line the cursor is on now
+    for i, val in enumerate(new):
+        if val != old[i]:
+            r, c = divmod(i, size)
+            target = below + 2 * (size - 1 - r)
+            if target > up:
+                parts.append(f"\033[{target - up}A")
+            elif target < up:
+                parts.append(f"\033[{up - target}B")
+            up = target
+            parts.append(f"\033[{2 + c * step}G{table[val + n2 * (val == i + 1)]}")
+    if up:
+        parts.append(f"\033[{up}B")
+    parts.append("\r")
+    sys.stdout.write("".join(parts))
+
 
 def _show_game(game: GamePlay, status: str = "") -> None:
     """Draw the full game screen.
 
     The stats line (Moves + Time) is printed last, with no trailing
     newline, so ``_update_time`` can cheaply overwrite it in-place
-    using ``\\r\\033[K``.
+    using ``\\r\\033[K``.  Repeat frames with the same status only
+    rewrite the cells that changed, plus the stats line.
     """
-    _clear()
+    global _last_frame
     size = game.size
-    print(f"  {_C}=== Sliding Puzzle ({size}\u00d7{size}) ==={_R}")
-    print()
-    print(_render_board(game.state.board))
-    print()
-    print(
-        f"  {_C}WASD{_R}/{_C}Arrows{_R}: move  |  "
-        f"{_C}N{_R}: hint  |  "
-        f"{_C}R{_R}: restart  |  "
-        f"{_C}Q{_R}: back"
-    )
+    key = ("play", size, status)
+    flat = tuple(game.state.board.flat())
+    below = 6 if status else 5
+    if _last_frame is not None and _last_frame[0] == key and _fits(size, below):
+        _patch_cells(size, _last_frame[1], flat, below)
+        state = game.state
+        _emit([
+            _STATS_UPDATE_FMT % (state.moves, _format_time(state.elapsed_time))
+        ])
+        _last_frame = (key, flat)
+        return
+
+    _clear()
+    parts = [
+        f"  {_C}=== Sliding Puzzle ({size}\u00d7{size}) ==={_R}\n\n",
+        _render_tiles(size, flat),
+        "\n\n",
+        _PLAY_CONTROLS,
+        "\n",
+    ]
     if status:
-        print(f"  {status}")
+        parts.append(f"  {status}\n")
     # Stats at the very bottom — no trailing newline.
-    sys.stdout.write(f"\n{_stats_line(game)}")
-    sys.stdout.flush()
+    parts.append(f"\n{_stats_line(game)}")
+    _emit(parts)
+    _last_frame = (key, flat)
 
 
-def _update_time(game: GamePlay) -> None:
-    """Overwrite just the stats (last) line in-place."""
-    sys.stdout.write(f"\r\033[K{_stats_line(game)}")
-    sys.stdout.flush()
+def _update_time(game: GamePlay, shown: str | None = None) -> str:
+    """Overwrite just the stats (last) line in-place.
+
+    Nothing is written if the line equals *shown* (what the previous call
+    returned).  Returns the line now on screen.
+    """
+    state = game.state
+    line = _STATS_UPDATE_FMT % (state.moves, _format_time(state.elapsed_time))
+    if line != shown:
+        sys.stdout.write(line)
+        sys.stdout.flush()
+    return line
 
 
 def _show_study(game: GamePlay, status: str = "") -> None:
-    _clear()
+    global _last_frame
     size = game.size
-    print(f"  {_Y}=== Study ({size}\u00d7{size}) ==={_R}")
-    print()
-    print(_render_board(game.state.board))
+    key = ("study", size, status)
+    flat = tuple(game.state.board.flat())
+    below = 6 if status else 4
+    if _last_frame is not None and _last_frame[0] == key and _fits(size, below):
+        _patch_cells(size, _last_frame[1], flat, below)
+        _last_frame = (key, flat)
+        return
+
+    _clear()
+    parts = [
+        f"  {_Y}=== Study ({size}\u00d7{size}) ==={_R}\n\n",
+        _render_tiles(size, flat),
+        "\n",
+    ]
     if status:
-        print(f"\n  {status}")
-    print()
-    print(
-        f"  {_C}WASD{_R}/{_C}Arrows{_R}: move  |  "
-        f"{_Y}R{_R}: scramble  |  "
-        f"{_C}N{_R}: hint  |  "
-        f"{_C}V{_R}: solve  |  "
-        f"{_C}Q{_R}: back"
-    )
+        parts.append(f"\n  {status}\n")
+    parts.append(f"\n{_STUDY_CONTROLS}\n")
+    _emit(parts)
+    _last_frame = (key, flat)
 
 
 def _show_win(game: GamePlay) -> None:
     _clear()
     size = game.size
-    print(f"  {_G}=== Sliding Puzzle ({size}\u00d7{size}) ==={_R}")
-    print()
-    print(_render_board(game.state.board))
-    print()
-    print(f"  {_G}\u2605 CONGRATULATIONS! You solved it! \u2605{_R}")
-    print()
-    print(
-        f"  Moves: {_Y}{game.state.moves}{_R}  |  "
-        f"Time: {_Y}{_format_time(game.state.elapsed_time)}{_R}"
-    )
-
-
-def _show_highscores(manager: HighScoreManager) -> None:
-    _clear()
-    print()
-    print(f"  {_BOLD}=== HIGH SCORES ==={_R}")
+    _emit([
+        f"  {_G}=== Sliding Puzzle ({size}\u00d7{size}) ==={_R}\n\n",
+        _render_board(game.state.board),
+        f"\n\n  {_G}\u2605 CONGRATULATIONS! You solved it! \u2605{_R}\n\n",
+        _stats_line(game),
+        "\n",
+    ])
+
+
+@lru_cache(maxsize=1)
+def _highscores_text(manager: HighScoreManager, version: int) -> str:
+    """The scores screen body; rebuilt only when *version* changes."""
+    lines = ["", f"  {_BOLD}=== HIGH SCORES ==={_R}"]
     sizes = manager.get_all_sizes()
     if not sizes:
-        print(f"\n  {_DIM}No high scores yet.{_R}")
+        lines.append(f"\n  {_DIM}No high scores yet.{_R}")
     else:
         for size in sizes:
-            print(f"\n  {_C}--- {size}\u00d7{size} ---{_R}")
+            lines.append(f"\n  {_C}--- {size}\u00d7{size} ---{_R}")
             scores = manager.get_scores(size)
             for i, e in enumerate(scores[:10], 1):
-                print(
+                lines.append(
                     f"  {i:>2}. {_Y}{e.moves:>4}{_R} moves  "
                     f"{_Y}{e.time:>7.1f}s{_R}  "
                     f"{_DIM}({e.date}){_R}"
                 )
-    print(f"\n  {_DIM}Press any key to go back.{_R}")
+    lines.append(f"\n  {_DIM}Press any key to go back.{_R}")
+    return "\n".join(lines)
+
+
+def _show_highscores(manager: HighScoreManager) -> None:
+    manager.reload()
+    _clear()
+    _emit([_highscores_text(manager, manager.version), "\n"])
     get_key()
 
 
@@ -248,36 +474,42 @@ def _show_highscores(manager: HighScoreManager) -> None:
 
 def _play_game(size: int, manager: HighScoreManager) -> None:
     """Play mode — hint only, scored."""
+    fd = sys.stdin.fileno()
+    _cell_table(size)  # build the cell strings before the first frame
     while True:
         game = GamePlay(size)
         status = ""
 
-        while not game.is_won:
-            _show_game(game, status)
-            status = ""
-
-            # Wait for input; update the time display every 0.5 s.
-            while True:
-                key = get_key_timeout(0.5)
-                if key is not None:
-                    break
-                _update_time(game)
-
-            direction_map = {
-                "up": Direction.UP,
-                "down": Direction.DOWN,
-                "left": Direction.LEFT,
-                "right": Direction.RIGHT,
-            }
-
-            if key in direction_map:
-                game.move(direction_map[key])
-            elif key == "hint":
-                status = _apply_hint(game)
-            elif key == "restart":
-                game = GamePlay(size)
-            elif key == "quit":
-                return
+        # Raw mode once for the whole game, so each poll is a bare select.
+        with raw_mode(fd):
+            dirty = True
+            while not game.is_won:
+                # Repaint only when something visible changed: a move, a
+                # new status, or an old status that must now be cleared.
+                if dirty:
+                    _show_game(game, status)
+                    dirty = bool(status)
+                    status = ""
+                    shown = None
+
+                # Wait for input; wake only when the shown time would change.
+                while True:
+                    key = get_key_timeout_raw(fd, _until_next_tick(game))
+                    if key is not None:
+                        break
+                    shown = _update_time(game, shown)
+
+                if key in _DIRECTION_MAP:
+                    if game.move(_DIRECTION_MAP[key]):
+                        dirty = True
+                elif key == "hint":
+                    status = _apply_hint(game)
+                    dirty = True
+                elif key == "restart":
+                    game = GamePlay(size)
+                    dirty = True
+                elif key == "quit":
+                    return
 
         # -- win ---------------------------------------------------------------
         game.state.pause()
@@ -285,8 +517,8 @@ def _play_game(size: int, manager: HighScoreManager) -> None:
 
         entry = HighScoreEntry(
             moves=game.state.moves,
-            time=round(game.state.elapsed_time, 2),
-            date=datetime.now().strftime("%Y-%m-%d %H:%M"),
+            time_ms=round(game.state.elapsed_time * 1000),
+            date=time.strftime("%Y-%m-%d %H:%M"),
         )
         manager.add_score(size, entry)
         print(f"\n  {_DIM}Score saved!{_R}")
@@ -305,29 +537,30 @@ def _study_game(size: int) -> None:
     board = GameGenerator.solved(size)
     game = GamePlay.from_board(board)
     status = ""
+    _cell_table(size)  # build the cell strings before the first frame
 
+    dirty = True
     while True:
-        _show_study(game, status)
-        status = ""
+        if dirty:
+            _show_study(game, status)
+            dirty = bool(status)
+            status = ""
         key = get_key()
 
-        direction_map = {
-            "up": Direction.UP,
-            "down": Direction.DOWN,
-            "left": Direction.LEFT,
-            "right": Direction.RIGHT,
-        }
-
-        if key in direction_map:
-            game.move(direction_map[key])
+        if key in _DIRECTION_MAP:
+            if game.move(_DIRECTION_MAP[key]):
+                dirty = True
         elif key == "restart":
             board = GameGenerator.generate(size)
             game = GamePlay.from_board(board)
             status = f"{_Y}Scrambled!{_R}"
+            dirty = True
         elif key == "hint":
             status = _apply_hint(game)
+            dirty = True
         elif key == "solve":
             status = _auto_solve(game)
+            dirty = True
         elif key == "quit":
             return
 
@@ -340,18 +573,26 @@ def _menu_loop(data_dir: Path) -> None:
     manager = HighScoreManager(hs_path)
     sel_idx = 0  # default: Easy 3×3
 
+    # Full paints only on entry and when coming back from a sub-screen;
+    # arrow keys rewrite the selector line in place.
+    repaint = True
     while True:
-        _show_menu(sel_idx)
+        if repaint:
+            _show_menu(sel_idx)
+        repaint = True
         key = get_key()
 
         if key == "quit":
             _clear()
             print("  Goodbye!\n")
             return
-        elif key == "left":
-            sel_idx = max(0, sel_idx - 1)
-        elif key == "right":
-            sel_idx = min(len(_DIFFICULTIES) - 1, sel_idx + 1)
+        elif key in ("left", "right"):
+            step = -1 if key == "left" else 1
+            new_idx = min(len(_DIFFICULTIES) - 1, max(0, sel_idx + step))
+            if new_idx != sel_idx:
+                sel_idx = new_idx
+                _update_menu_selection(sel_idx)
+            repaint = False
         elif key in ("1", "enter"):
             _play_game(_DIFFICULTIES[sel_idx][1], manager)
         elif key == "2":
@@ -364,6 +605,41 @@ def _menu_loop(data_dir: Path) -> None:
 # -- public entry point -------------------------------------------------------
 
 
+@contextmanager
+def _buffered_stdout(buffer_size: int = 16384) -> Iterator[None]:
+    """Swap ``sys.stdout`` for a large, non-line-buffered writer.
+
+    A tty stdout is line-buffered, so each printed line of a frame was its
+    own ``write(2)``.  With one big buffer a frame goes out in a single
+    write at the next explicit flush (end of frame, or before waiting for
+    a key — see ``input_handler``).
+    """
+    orig = sys.stdout
+    if not orig.isatty():
+        yield
+        return
+    orig.flush()
+    raw = io.FileIO(orig.fileno(), "w", closefd=False)
+    sys.stdout = io.TextIOWrapper(
+        io.BufferedWriter(raw, buffer_size=buffer_size),
+        encoding=orig.encoding,
+        errors=orig.errors,
+    )
+    try:
+        yield
+    finally:
+        sys.stdout.flush()
+        sys.stdout = orig
+
+
 def run(data_dir: Path) -> None:
     """Launch the vanilla CLI with interactive menu."""
-    _menu_loop(data_dir)
+    sigwinch = getattr(signal, "SIGWINCH", None)  # absent on Windows
+    if sigwinch is not None:
+        prev = signal.signal(sigwinch, _refresh_rows)
+    try:
+        with _buffered_stdout():
+            _menu_loop(data_dir)
+    finally:
+        if sigwinch is not None:
+            signal.signal(sigwinch, prev or signal.SIG_DFL)
@@ -6,10 +6,9 @@ and high-score display.  No terminal interaction required.
 
 from __future__ import annotations
 
-import enum
 import random
 import time
-from datetime import datetime
+from functools import cache, lru_cache
 from pathlib import Path
 
 import pygame
@@ -44,22 +43,50 @@ TILE_GAP = 4
 MARGIN = 20
 BOARD_MAX = WIN_W - 2 * MARGIN  # max board width/height in px
 
+# Arrow / WASD key → tile move direction.
+_KEY_DIRECTIONS: dict[int, Direction] = {
+    pygame.K_UP: Direction.UP,
+    pygame.K_w: Direction.UP,
+    pygame.K_DOWN: Direction.DOWN,
+    pygame.K_s: Direction.DOWN,
+    pygame.K_LEFT: Direction.LEFT,
+    pygame.K_a: Direction.LEFT,
+    pygame.K_RIGHT: Direction.RIGHT,
+    pygame.K_d: Direction.RIGHT,
+}
+
+# Posted once a second during a timed game to advance the clock display.
+_TICK = pygame.USEREVENT + 1
+
+# Event types the app handles; all others are blocked at the SDL queue.
+_EVENT_TYPES = [
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEMOTION,
+    pygame.WINDOWEXPOSED,
+    _TICK,
+]
+
 
 # ---------------------------------------------------------------------------
-# Screen enum
+# Screen ids — plain ints that index PygameApp's handler/drawer tuples
 # ---------------------------------------------------------------------------
-class _Screen(enum.Enum):
-    MENU = "menu"
-    PLAYING = "playing"
-    WIN = "win"
-    SCORES = "scores"
+class _Screen:
+    MENU = 0
+    PLAYING = 1
+    WIN = 2
+    SCORES = 3
 
 
 # ---------------------------------------------------------------------------
 # Simple clickable button
 # ---------------------------------------------------------------------------
 class _Btn:
-    __slots__ = ("rect", "text", "font", "bg", "hover", "fg", "radius", "_hot")
+    __slots__ = (
+        "rect", "text", "font", "bg", "hover", "fg", "radius", "_hot",
+        "_x0", "_y0", "_x1", "_y1", "_lbl", "_lbl_fg",
+    )
 
     def __init__(
         self,
@@ -80,11 +107,24 @@ class _Btn:
         self.fg = fg
         self.radius = radius
         self._hot = False
+        self._x0, self._y0 = self.rect.topleft
+        self._x1, self._y1 = self.rect.bottomright
+        # Rendered label, redone only when fg changes (size-button selection).
+        self._lbl: pygame.Surface | None = None
+        self._lbl_fg: tuple | None = None
+
+    def set_y(self, y: int) -> None:
+        """Move the button vertically, keeping the cached extents in sync."""
+        self.rect.y = self._y0 = y
+        self._y1 = y + self.rect.height
 
     def draw(self, surf: pygame.Surface) -> None:
         c = self.hover if self._hot else self.bg
         pygame.draw.rect(surf, c, self.rect, border_radius=self.radius)
-        lbl = self.font.render(self.text, True, self.fg)
+        if self._lbl is None or self._lbl_fg != self.fg:
+            self._lbl = self.font.render(self.text, True, self.fg).convert_alpha()
+            self._lbl_fg = self.fg
+        lbl = self._lbl
         surf.blit(
             lbl,
             (
@@ -93,16 +133,35 @@ class _Btn:
             ),
         )
 
-    def motion(self, pos: tuple[int, int]) -> None:
-        self._hot = self.rect.collidepoint(pos)
+    def motion(self, pos: tuple[int, int]) -> bool:
+        """Update the hover state; return True if it changed."""
+        px, py = pos
+        hot = self._x0 <= px < self._x1 and self._y0 <= py < self._y1
+        changed = hot != self._hot
+        self._hot = hot
+        return changed
 
     def hit(self, pos: tuple[int, int]) -> bool:
-        return self.rect.collidepoint(pos)
+        px, py = pos
+        return self._x0 <= px < self._x1 and self._y0 <= py < self._y1
 
 
 # ---------------------------------------------------------------------------
-# Centring helpers
+# Font / text / centring helpers
 # ---------------------------------------------------------------------------
+@cache
+def _font_path(bold: bool) -> str | None:
+    """Helvetica (or its closest match) on this system; None = pygame's own."""
+    return pygame.font.match_font("Helvetica", bold=bold)
+
+
+@lru_cache(maxsize=1)
+def _clock(sec: int) -> str:
+    """``MM:SS`` for *sec* — redraws within the same second reuse it."""
+    m, s = divmod(sec, 60)
+    return f"{m:02d}:{s:02d}"
+
+
 def _cx(w: int) -> int:
     return (WIN_W - w) // 2
 
@@ -121,22 +180,49 @@ class PygameApp:
         self._sel_size = default_size if default_size in (3, 7, 10, 12) else 3
         self._images_dir = data_dir.parent / "assets" / "images"
         self._tile_images: dict[int, pygame.Surface] = {}
+        self._tile_surfs: dict[tuple[int, bool], pygame.Surface] = {}
         self._ref_image: pygame.Surface | None = None
 
         pygame.init()
-        self._surf = pygame.display.set_mode((WIN_W, WIN_H))
+        # Renderer-backed window; the loop paces itself on events, not vsync.
+        self._surf = pygame.display.set_mode(
+            (WIN_W, WIN_H), pygame.SCALED | pygame.DOUBLEBUF
+        )
         pygame.display.set_caption("Sliding Puzzle")
-        self._clock = pygame.time.Clock()
-
-        # Fonts
-        self._f_big = pygame.font.SysFont("Helvetica", 38, bold=True)
-        self._f_title = pygame.font.SysFont("Helvetica", 22, bold=True)
-        self._f_body = pygame.font.SysFont("Helvetica", 16)
-        self._f_btn = pygame.font.SysFont("Helvetica", 17, bold=True)
-        self._f_btn_sm = pygame.font.SysFont("Helvetica", 14, bold=True)
-        self._f_small = pygame.font.SysFont("Helvetica", 13)
-        self._f_score = pygame.font.SysFont("Helvetica", 14)
-
+        # Only queue what the handlers use; SDL drops everything else.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(_EVENT_TYPES)
+
+        # Fonts and rendered static text, shared across screens; both are
+        # tied to this pygame session and dropped when the loop exits.
+        self._fonts: dict[tuple[int, bool], pygame.font.Font] = {}
+        self._text_cache: dict[
+            tuple[pygame.font.Font, str, tuple], pygame.Surface
+        ] = {}
+        self._f_big = self._font(38, bold=True)
+        self._f_title = self._font(22, bold=True)
+        self._f_body = self._font(16)
+        self._f_btn = self._font(17, bold=True)
+        self._f_btn_sm = self._font(14, bold=True)
+        self._f_small = self._font(13)
+        self._f_score = self._font(14)
+
+        # Repaint bookkeeping: a full redraw + flip() after screen changes,
+        # otherwise only the rects in _dirty are pushed to the display, and
+        # nothing at all when the frame is unchanged.
+        self._dirty: list[pygame.Rect] = []
+        self._full_redraw = True
+        self._stats_rect = pygame.Rect(0, 44, WIN_W, self._f_body.get_linesize())
+        self._stats_stamp: tuple[int, int] | None = None
+        self._hot_btn: _Btn | None = None
+
+        # Indexed by the _Screen ids.
+        self._handlers = (
+            self._ev_menu, self._ev_game, self._ev_win, self._ev_scores,
+        )
+        self._drawers = (
+            self._draw_menu, self._draw_game, self._draw_win, self._draw_scores,
+        )
         self._screen = _Screen.MENU
         self._game: GamePlay | None = None
         self._won = False
@@ -263,10 +349,99 @@ class PygameApp:
 
     # ── helpers ─────────────────────────────────────────────────────────────
 
+    def _font(self, size: int, bold: bool = False) -> pygame.font.Font:
+        """Shared Font for *size*; the system font lookup happens once per weight."""
+        key = (size, bold)
+        f = self._fonts.get(key)
+        if f is None:
+            f = self._fonts[key] = pygame.font.Font(_font_path(bold), size)
+            if bold and _font_path(True) == _font_path(False):
+                f.set_bold(True)  # no bold face installed — embolden like SysFont
+        return f
+
+    def _text(
+        self, font: pygame.font.Font, text: str, color: tuple
+    ) -> pygame.Surface:
+        """Antialiased static *text* in *color*, rasterized once per triple.
+
+        Only for strings from a small fixed set — per-move or per-second
+        text is rendered directly so it cannot crowd the cache.
+        """
+        key = (font, text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surf
+        return surf
+
+    @property
+    def _screen(self) -> int:
+        return self._cur_screen
+
+    @_screen.setter
+    def _screen(self, screen: int) -> None:
+        # Any screen switch (or restart onto the same one) repaints fully.
+        self._cur_screen = screen
+        self._invalidate()
+        if screen != _Screen.PLAYING:
+            pygame.time.set_timer(_TICK, 0)
+        if self._hot_btn is not None:
+            self._hot_btn.motion((-1, -1))  # its button may be gone now
+            self._hot_btn = None
+
+    def _invalidate(self, *rects: pygame.Rect) -> None:
+        """Mark *rects* for repaint — or the whole window if none given."""
+        if rects:
+            self._dirty.extend(rects)
+        else:
+            self._full_redraw = True
+
+    def _hover(self, btns: list[_Btn], pos: tuple[int, int]) -> None:
+        """Move the hover highlight; the last hot button is re-tested first."""
+        hot = self._hot_btn
+        if hot is not None:
+            if hot.hit(pos):
+                return
+            hot.motion(pos)
+            self._hot_btn = None
+            self._dirty.append(hot.rect.copy())
+        for b in btns:
+            if b.motion(pos):
+                self._hot_btn = b
+                self._dirty.append(b.rect.copy())
+                break
+
+    def _mark_stats(self) -> None:
+        """Dirty the header's Moves/Time band when its text would change."""
+        game = self._game
+        assert game is not None
+        stamp = (game.state.moves, int(game.state.elapsed_time))
+        if stamp != self._stats_stamp:
+            self._stats_stamp = stamp
+            self._dirty.append(self._stats_rect)
+
+    def _after_move(self, before: tuple[int, int], moved: bool) -> None:
+        """Invalidate what a move attempt changed; clears the status line.
+
+        Only a move can solve the board, so this is where a win is detected.
+        """
+        if self._status_msg:
+            self._status_msg = ""
+            self._invalidate()  # the footer shifts up with the status gone
+        elif moved:
+            tpx, ox, oy, _ = self._tile_layout()
+            after = self._game.state.board.blank_pos  # type: ignore[union-attr]
+            self._invalidate(
+                self._tile_rect(*before, tpx, ox, oy),
+                self._tile_rect(*after, tpx, ox, oy),
+            )
+        if moved and not self._study_mode:
+            self._mark_stats()
+            self._check_win()
+
     @staticmethod
     def _fmt(seconds: float) -> str:
-        m, s = divmod(int(seconds), 60)
-        return f"{m:02d}:{s:02d}"
+        return _clock(int(seconds))
 
     def _tile_layout(self) -> tuple[int, int, int, int]:
         """Return (tile_px, origin_x, origin_y, total_px) for current game."""
@@ -307,19 +482,19 @@ class PygameApp:
         # Reference thumbnail (from original high-res image)
         self._ref_image = pygame.transform.smoothscale(
             full_img, (self._REF_SIZE, self._REF_SIZE)
-        )
+        ).convert()
 
         sz = self._game.size  # type: ignore[union-attr]
         tpx = (BOARD_MAX - (sz + 1) * TILE_GAP) // sz
         total_px = sz * tpx
 
         # Badge font for number overlays
-        self._f_badge = pygame.font.SysFont(
-            "Helvetica", max(10, tpx // 5), bold=True
-        )
+        self._f_badge = self._font(max(10, tpx // 5), bold=True)
 
         # Scale image to fit the board area
-        full_img = pygame.transform.smoothscale(full_img, (total_px, total_px))
+        full_img = pygame.transform.smoothscale(
+            full_img, (total_px, total_px)
+        ).convert()
 
         for val in range(1, sz * sz):
             # Tile value v maps to grid position ((v-1)//sz, (v-1)%sz) in the
@@ -329,8 +504,40 @@ class PygameApp:
             tile_surf = full_img.subsurface(
                 pygame.Rect(tc * tpx, tr * tpx, tpx, tpx)
             ).copy()
+            # number badge overlay, baked in so a frame is a single blit
+            num_lbl = self._f_badge.render(str(val), True, (255, 255, 255))
+            badge = pygame.Surface(
+                (num_lbl.get_width() + 8, num_lbl.get_height() + 4),
+                pygame.SRCALPHA,
+            )
+            badge.fill((0, 0, 0, 150))
+            badge.blit(num_lbl, (4, 2))
+            tile_surf.blit(badge, (2, 2))
             self._tile_images[val] = tile_surf
 
+    def _prepare_tile_surfs(self) -> None:
+        """Pre-render the board backdrop and the plain numbered tiles,
+        the latter keyed by (value, correct)."""
+        tpx, _, _, total = self._tile_layout()
+        self._board_bg = pygame.Surface((total, total), pygame.SRCALPHA).convert_alpha()
+        pygame.draw.rect(
+            self._board_bg, COL_MANTLE, self._board_bg.get_rect(), border_radius=10
+        )
+
+        self._tile_surfs = {}
+        if self._tile_images:
+            return
+        sz = self._game.size  # type: ignore[union-attr]
+        f_tile = self._font(max(14, tpx // 3), bold=True)
+        for val in range(1, sz * sz):
+            lbl = f_tile.render(str(val), True, COL_BASE)
+            pos = ((tpx - lbl.get_width()) // 2, (tpx - lbl.get_height()) // 2)
+            for correct, col in ((False, COL_BLUE), (True, COL_GREEN)):
+                tile = pygame.Surface((tpx, tpx), pygame.SRCALPHA).convert_alpha()
+                pygame.draw.rect(tile, col, tile.get_rect(), border_radius=6)
+                tile.blit(lbl, pos)
+                self._tile_surfs[val, correct] = tile
+
     # ── drawing ─────────────────────────────────────────────────────────────
 
     def _draw_menu(self) -> None:
@@ -338,12 +545,12 @@ class PygameApp:
 
         _blit_center(
             self._surf,
-            self._f_big.render("SLIDING  PUZZLE", True, COL_TEXT),
+            self._text(self._f_big, "SLIDING  PUZZLE", COL_TEXT),
             80,
         )
         _blit_center(
             self._surf,
-            self._f_body.render("Select difficulty", True, COL_SUBTEXT),
+            self._text(self._f_body, "Select difficulty", COL_SUBTEXT),
             210,
         )
 
@@ -364,29 +571,27 @@ class PygameApp:
         board = game.state.board
         sz = game.size
         tpx, ox, oy, total = self._tile_layout()
-        f_tile = pygame.font.SysFont(
-            "Helvetica", max(14, tpx // 3), bold=True
-        )
 
         # header
         if self._study_mode:
             _blit_center(
                 self._surf,
-                self._f_title.render(
-                    f"Study  {sz}\u00d7{sz}", True, COL_YELLOW
+                self._text(
+                    self._f_title, f"Study  {sz}\u00d7{sz}", COL_YELLOW
                 ),
                 14,
             )
         else:
             _blit_center(
                 self._surf,
-                self._f_title.render(
-                    f"Sliding Puzzle  {sz}\u00d7{sz}", True, COL_TEXT
+                self._text(
+                    self._f_title, f"Sliding Puzzle  {sz}\u00d7{sz}", COL_TEXT
                 ),
                 14,
             )
             _blit_center(
                 self._surf,
+                # Changes every move and second: rendered, not cached.
                 self._f_body.render(
                     f"Moves: {game.state.moves}    "
                     f"Time: {self._fmt(game.state.elapsed_time)}",
@@ -397,46 +602,26 @@ class PygameApp:
             )
 
         # board bg
-        pygame.draw.rect(
-            self._surf,
-            COL_MANTLE,
-            pygame.Rect(_cx(total), 76, total, total),
-            border_radius=10,
-        )
+        self._surf.blit(self._board_bg, (_cx(total), 76))
 
         # tiles
+        correct = board.correctness_mask()
         for r in range(sz):
             for c in range(sz):
                 val = board.tiles[r][c]
                 if val == 0:
                     continue
+                ok = correct >> (r * sz + c) & 1
                 rect = self._tile_rect(r, c, tpx, ox, oy)
                 if val in self._tile_images:
                     self._surf.blit(self._tile_images[val], rect.topleft)
-                    # number badge overlay
-                    num_lbl = self._f_badge.render(str(val), True, (255, 255, 255))
-                    bw = num_lbl.get_width() + 8
-                    bh = num_lbl.get_height() + 4
-                    badge = pygame.Surface((bw, bh), pygame.SRCALPHA)
-                    badge.fill((0, 0, 0, 150))
-                    badge.blit(num_lbl, (4, 2))
-                    self._surf.blit(badge, (rect.x + 2, rect.y + 2))
                     # green border for correct tiles
-                    if board.is_tile_correct(r, c):
+                    if ok:
                         pygame.draw.rect(
                             self._surf, COL_GREEN, rect, width=3, border_radius=4
                         )
                 else:
-                    col = COL_GREEN if board.is_tile_correct(r, c) else COL_BLUE
-                    pygame.draw.rect(self._surf, col, rect, border_radius=6)
-                    lbl = f_tile.render(str(val), True, COL_BASE)
-                    self._surf.blit(
-                        lbl,
-                        (
-                            rect.centerx - lbl.get_width() // 2,
-                            rect.centery - lbl.get_height() // 2,
-                        ),
-                    )
+                    self._surf.blit(self._tile_surfs[val, ok == 1], rect.topleft)
 
         # reference image thumbnail (top-right)
         if self._ref_image is not None:
@@ -449,7 +634,7 @@ class PygameApp:
                 border_radius=6,
             )
             self._surf.blit(self._ref_image, (rx, ry))
-            ref_lbl = self._f_small.render("Ref", True, COL_SUBTEXT)
+            ref_lbl = self._text(self._f_small, "Ref", COL_SUBTEXT)
             self._surf.blit(
                 ref_lbl, (rx + (rs - ref_lbl.get_width()) // 2, ry + rs + 4)
             )
@@ -457,7 +642,7 @@ class PygameApp:
         # action buttons row
         btn_y = 76 + total + 10
         for btn in self._game_action_btns:
-            btn.rect.y = btn_y
+            btn.set_y(btn_y)
             btn.draw(self._surf)
 
         # status message
@@ -484,7 +669,7 @@ class PygameApp:
             )
         _blit_center(
             self._surf,
-            self._f_small.render(hint_text, True, COL_OVERLAY0),
+            self._text(self._f_small, hint_text, COL_OVERLAY0),
             footer_y,
         )
 
@@ -495,7 +680,7 @@ class PygameApp:
 
         _blit_center(
             self._surf,
-            self._f_big.render("\u2605  S O L V E D  \u2605", True, COL_GREEN),
+            self._text(self._f_big, "\u2605  S O L V E D  \u2605", COL_GREEN),
             100,
         )
 
@@ -512,62 +697,61 @@ class PygameApp:
         self._win_again.draw(self._surf)
         self._win_menu.draw(self._surf)
 
-    def _draw_scores(self) -> None:
-        self._surf.fill(COL_BASE)
-        _blit_center(
-            self._surf,
-            self._f_big.render("HIGH  SCORES", True, COL_TEXT),
-            24,
-        )
+    def _render_scores(self) -> None:
+        """Re-read the high scores and lay them out into ``_scores_surf``."""
+        self._hs.reload()
+        surf = self._scores_surf = pygame.Surface((WIN_W, WIN_H)).convert()
+        surf.fill(COL_BASE)
+        _blit_center(surf, self._text(self._f_big, "HIGH  SCORES", COL_TEXT), 24)
 
-        self._hs = HighScoreManager(self._data_dir / "highscores.json")
         sizes = self._hs.get_all_sizes()
         y = 90
 
         if not sizes:
             _blit_center(
-                self._surf,
-                self._f_body.render("No high scores yet.", True, COL_OVERLAY0),
+                surf,
+                self._text(self._f_body, "No high scores yet.", COL_OVERLAY0),
                 y + 30,
             )
         else:
             for sz in sizes:
                 _blit_center(
-                    self._surf,
-                    self._f_btn_sm.render(
-                        f"\u2014  {sz}\u00d7{sz}  \u2014", True, COL_BLUE
+                    surf,
+                    self._text(
+                        self._f_btn_sm, f"\u2014  {sz}\u00d7{sz}  \u2014", COL_BLUE
                     ),
                     y,
                 )
                 y += 28
                 for i, e in enumerate(self._hs.get_scores(sz)[:5], 1):
                     row = f"{i}.  {e.moves} moves   {e.time:.1f}s   ({e.date})"
-                    self._surf.blit(
-                        self._f_score.render(row, True, COL_SUBTEXT), (60, y)
-                    )
+                    surf.blit(self._f_score.render(row, True, COL_SUBTEXT), (60, y))
                     y += 22
                 y += 14
                 if y > WIN_H - 90:
                     break
 
+    def _draw_scores(self) -> None:
+        self._surf.blit(self._scores_surf, (0, 0))
         self._score_back.draw(self._surf)
 
     # ── event handling ──────────────────────────────────────────────────────
 
     def _ev_menu(self, ev: pygame.event.Event) -> bool:
         if ev.type == pygame.MOUSEMOTION:
-            for b in self._menu_all:
-                b.motion(ev.pos)
+            self._hover(self._menu_all, ev.pos)
         elif ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
             for s, b in self._size_btns.items():
                 if b.hit(ev.pos):
                     self._sel_size = s
+                    self._invalidate(*(btn.rect for btn in self._size_btns.values()))
                     return True
             if self._play_btn.hit(ev.pos):
                 self._start_game()
             elif self._load_btn.hit(ev.pos):
                 self._open_study()
             elif self._hs_btn.hit(ev.pos):
+                self._render_scores()
                 self._screen = _Screen.SCORES
             elif self._quit_btn.hit(ev.pos):
                 return False
@@ -583,9 +767,10 @@ class PygameApp:
     def _ev_game(self, ev: pygame.event.Event) -> bool:
         game = self._game
         assert game is not None
-        if ev.type == pygame.MOUSEMOTION:
-            for btn in self._game_action_btns:
-                btn.motion(ev.pos)
+        if ev.type == _TICK:
+            self._mark_stats()
+        elif ev.type == pygame.MOUSEMOTION:
+            self._hover(self._game_action_btns, ev.pos)
         elif ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
             # Check action buttons first
             if self._study_mode and self._scramble_btn and self._scramble_btn.hit(ev.pos):
@@ -597,29 +782,24 @@ class PygameApp:
             if self._study_mode and self._solve_btn and self._solve_btn.hit(ev.pos):
                 self._do_solve()
                 return True
-            # Then check tiles
+            # Then check tiles: the cell follows from the offset into the
+            # grid; the remainder rejects clicks that land in a gap.
             tpx, ox, oy, _ = self._tile_layout()
-            for r in range(game.size):
-                for c in range(game.size):
-                    if self._tile_rect(r, c, tpx, ox, oy).collidepoint(ev.pos):
-                        if game.state.board.tiles[r][c] != 0:
-                            game.move_tile(r, c)
-                            self._status_msg = ""
-                        return True
+            step = tpx + TILE_GAP
+            x, y = ev.pos[0] - ox, ev.pos[1] - oy
+            if x < 0 or y < 0:
+                return True
+            (r, ry), (c, rx) = divmod(y, step), divmod(x, step)
+            if (
+                r < game.size and c < game.size and rx < tpx and ry < tpx
+                and game.state.board.tiles[r][c] != 0
+            ):
+                before = game.state.board.blank_pos
+                self._after_move(before, game.move_tile(r, c))
         elif ev.type == pygame.KEYDOWN:
-            _dirs = {
-                pygame.K_UP: Direction.UP,
-                pygame.K_w: Direction.UP,
-                pygame.K_DOWN: Direction.DOWN,
-                pygame.K_s: Direction.DOWN,
-                pygame.K_LEFT: Direction.LEFT,
-                pygame.K_a: Direction.LEFT,
-                pygame.K_RIGHT: Direction.RIGHT,
-                pygame.K_d: Direction.RIGHT,
-            }
-            if ev.key in _dirs:
-                game.move(_dirs[ev.key])
-                self._status_msg = ""
+            if ev.key in _KEY_DIRECTIONS:
+                before = game.state.board.blank_pos
+                self._after_move(before, game.move(_KEY_DIRECTIONS[ev.key]))
             elif ev.key == pygame.K_n:
                 self._do_hint()
             elif ev.key == pygame.K_v and self._study_mode:
@@ -637,8 +817,7 @@ class PygameApp:
 
     def _ev_win(self, ev: pygame.event.Event) -> bool:
         if ev.type == pygame.MOUSEMOTION:
-            self._win_again.motion(ev.pos)
-            self._win_menu.motion(ev.pos)
+            self._hover([self._win_again, self._win_menu], ev.pos)
         elif ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
             if self._win_again.hit(ev.pos):
                 self._start_game()
@@ -653,7 +832,7 @@ class PygameApp:
 
     def _ev_scores(self, ev: pygame.event.Event) -> bool:
         if ev.type == pygame.MOUSEMOTION:
-            self._score_back.motion(ev.pos)
+            self._hover([self._score_back], ev.pos)
         elif ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
             if self._score_back.hit(ev.pos):
                 self._screen = _Screen.MENU
@@ -680,6 +859,8 @@ class PygameApp:
         else:
             game.move(hint)
             self._status_msg = f"Hint: {hint.value}"
+        self._invalidate()
+        self._check_win()
 
     def _do_solve(self) -> None:
         game = self._game
@@ -688,6 +869,7 @@ class PygameApp:
             moves = Solver.solve(game.state.board)
         except NotImplementedError:
             self._status_msg = "Solver not yet implemented"
+            self._invalidate()
             return
 
         if not moves:
@@ -695,6 +877,7 @@ class PygameApp:
                 "Already solved!" if game.state.board.is_solved()
                 else "Board is unsolvable"
             )
+            self._invalidate()
             return
 
         # Animate moves
@@ -707,6 +890,7 @@ class PygameApp:
             time.sleep(0.05)
 
         self._status_msg = f"Solved in {len(moves)} moves!"
+        self._invalidate()
 
     def _do_scramble(self) -> None:
         from backend.engine.gamegenerator import GameGenerator as GG
@@ -714,6 +898,7 @@ class PygameApp:
         self._game = GamePlay.from_board(board)
         self._won = False
         self._status_msg = "Scrambled!"
+        self._invalidate()
 
     def _open_study(self) -> None:
         """Enter study mode — starts from solved board."""
@@ -725,6 +910,7 @@ class PygameApp:
         self._status_msg = ""
         self._build_game_btns()
         self._prepare_tile_images()
+        self._prepare_tile_surfs()
         self._screen = _Screen.PLAYING
 
     # ── game state ──────────────────────────────────────────────────────────
@@ -736,11 +922,13 @@ class PygameApp:
         self._status_msg = ""
         self._build_game_btns()
         self._prepare_tile_images()
+        self._prepare_tile_surfs()
         self._screen = _Screen.PLAYING
+        pygame.time.set_timer(_TICK, 1000)  # restarts in step with the new clock
 
     def _check_win(self) -> None:
         game = self._game
-        if game is None or self._won or not game.is_won:
+        if game is None or self._won or self._study_mode or not game.is_won:
             return
         self._won = True
         game.state.pause()
@@ -748,8 +936,8 @@ class PygameApp:
             game.size,
             HighScoreEntry(
                 moves=game.state.moves,
-                time=round(game.state.elapsed_time, 2),
-                date=datetime.now().strftime("%Y-%m-%d %H:%M"),
+                time_ms=round(game.state.elapsed_time * 1000),
+                date=time.strftime("%Y-%m-%d %H:%M"),
             ),
         )
         self._build_win_btns()
@@ -758,39 +946,43 @@ class PygameApp:
     # ── main loop ───────────────────────────────────────────────────────────
 
     def run_loop(self) -> None:
-        _dispatch = {
-            _Screen.MENU: self._ev_menu,
-            _Screen.PLAYING: self._ev_game,
-            _Screen.WIN: self._ev_win,
-            _Screen.SCORES: self._ev_scores,
-        }
-        _draw = {
-            _Screen.MENU: self._draw_menu,
-            _Screen.PLAYING: self._draw_game,
-            _Screen.WIN: self._draw_win,
-            _Screen.SCORES: self._draw_scores,
-        }
-
         running = True
         while running:
-            for ev in pygame.event.get():
+            if self._full_redraw or self._dirty:
+                self._drawers[self._screen]()
+                if self._full_redraw:
+                    pygame.display.flip()
+                else:
+                    pygame.display.update(self._dirty)
+                self._full_redraw = False
+                self._dirty.clear()
+
+            # Nothing animates between inputs, so sleep until the next event;
+            # mid-game, _TICK wakes the loop when the clock display advances.
+            first = pygame.event.wait()
+            # Hover only depends on where the pointer ended up, so a burst of
+            # MOUSEMOTION collapses to its latest event each frame.
+            events = pygame.event.get(exclude=pygame.MOUSEMOTION)
+            motion = pygame.event.get(pygame.MOUSEMOTION)
+            if first.type == pygame.MOUSEMOTION:
+                motion.insert(0, first)
+            else:
+                events.insert(0, first)
+            if motion:
+                events.append(motion[-1])
+            for ev in events:
                 if ev.type == pygame.QUIT:
                     running = False
                     break
-                handler = _dispatch.get(self._screen)
-                if handler and not handler(ev):
+                if ev.type == pygame.WINDOWEXPOSED:
+                    self._invalidate()  # window contents were lost
+                    continue
+                if not self._handlers[self._screen](ev):
                     running = False
                     break
 
-            if self._screen == _Screen.PLAYING and not self._study_mode:
-                self._check_win()
-
-            drawer = _draw.get(self._screen)
-            if drawer:
-                drawer()
-            pygame.display.flip()
-            self._clock.tick(30)
-
+        self._text_cache.clear()
+        self._fonts.clear()
         pygame.quit()
 
 
@@ -9,7 +9,6 @@ from __future__ import annotations
 import random
 import sys
 import time as _time
-from datetime import datetime
 from pathlib import Path
 
 from PyQt6.QtCore import QSize, Qt, QTimer
@@ -415,10 +414,12 @@ class _GamePage(QWidget):
 
     def _sync(self) -> None:
         board = self.game.state.board
+        correct = board.correctness_mask()
         for r in range(self._size):
             for c in range(self._size):
                 v = board.tiles[r][c]
                 b = self._btns[r][c]
+                ok = correct >> (r * self._size + c) & 1
                 if v == 0:
                     b.setText("")
                     b.setIcon(QIcon())
@@ -431,7 +432,7 @@ class _GamePage(QWidget):
                     b.setIconSize(QSize(self._tile_px, self._tile_px))
                     border = (
                         f"border:3px solid {_GREEN};"
-                        if board.is_tile_correct(r, c)
+                        if ok
                         else "border:1px solid #2a2a3e;"
                     )
                     b.setStyleSheet(
@@ -442,8 +443,8 @@ class _GamePage(QWidget):
                 else:
                     b.setIcon(QIcon())
                     b.setText(str(v))
-                    bg = _GREEN if board.is_tile_correct(r, c) else _BLUE
-                    hv = _GREEN_H if board.is_tile_correct(r, c) else _BLUE_H
+                    bg = _GREEN if ok else _BLUE
+                    hv = _GREEN_H if ok else _BLUE_H
                     b.setStyleSheet(
                         f"QPushButton{{background:{bg};color:{_BASE};"
                         f"border:none;border-radius:8px;font-weight:bold;}}"
@@ -553,8 +554,8 @@ class _GamePage(QWidget):
             self._size,
             HighScoreEntry(
                 moves=self.game.state.moves,
-                time=round(self.game.state.elapsed_time, 2),
-                date=datetime.now().strftime("%Y-%m-%d %H:%M"),
+                time_ms=round(self.game.state.elapsed_time * 1000),
+                date=_time.strftime("%Y-%m-%d %H:%M"),
             ),
         )
         self._controls.setText("Solved!   R  play again     M  menu")
@@ -674,6 +675,18 @@ _IDX_GAME = 1
 _IDX_WIN = 2
 _IDX_SCORES = 3
 
+# Arrow / WASD key → tile move direction.
+_KEY_DIRECTIONS: dict[Qt.Key, Direction] = {
+    Qt.Key.Key_Up: Direction.UP,
+    Qt.Key.Key_W: Direction.UP,
+    Qt.Key.Key_Down: Direction.DOWN,
+    Qt.Key.Key_S: Direction.DOWN,
+    Qt.Key.Key_Left: Direction.LEFT,
+    Qt.Key.Key_A: Direction.LEFT,
+    Qt.Key.Key_Right: Direction.RIGHT,
+    Qt.Key.Key_D: Direction.RIGHT,
+}
+
 
 def _fmt(secs: float) -> str:
     m, s = divmod(int(secs), 60)
@@ -711,6 +724,7 @@ class _MainWindow(QMainWindow):
         self._scores_page = _ScoresPage(self._hs)
         self._scores_page.back_btn.clicked.connect(self._show_menu)
         self._stack.addWidget(self._scores_page)  # 3
+        self._scores_version = self._hs.version
 
         self._stack.setCurrentIndex(_IDX_MENU)
 
@@ -739,15 +753,18 @@ class _MainWindow(QMainWindow):
         self._stack.setCurrentIndex(_IDX_GAME)
 
     def _show_scores(self) -> None:
-        self._hs = HighScoreManager(self._data_dir / "highscores.json")
-        page = _ScoresPage(self._hs)
-        page.back_btn.clicked.connect(self._show_menu)
-
-        old = self._stack.widget(_IDX_SCORES)
-        self._stack.removeWidget(old)
-        old.deleteLater()
-        self._stack.insertWidget(_IDX_SCORES, page)
-        self._scores_page = page
+        # Pick up changes from other processes; rebuild only if any arrived.
+        self._hs.reload()
+        if self._hs.version != self._scores_version:
+            page = _ScoresPage(self._hs)
+            page.back_btn.clicked.connect(self._show_menu)
+
+            old = self._stack.widget(_IDX_SCORES)
+            self._stack.removeWidget(old)
+            old.deleteLater()
+            self._stack.insertWidget(_IDX_SCORES, page)
+            self._scores_page = page
+            self._scores_version = self._hs.version
         self._stack.setCurrentIndex(_IDX_SCORES)
 
     def _show_win(self) -> None:
@@ -779,18 +796,8 @@ class _MainWindow(QMainWindow):
 
         elif idx == _IDX_GAME and self._game_page is not None:
             gp = self._game_page
-            _dirs = {
-                Qt.Key.Key_Up: Direction.UP,
-                Qt.Key.Key_W: Direction.UP,
-                Qt.Key.Key_Down: Direction.DOWN,
-                Qt.Key.Key_S: Direction.DOWN,
-                Qt.Key.Key_Left: Direction.LEFT,
-                Qt.Key.Key_A: Direction.LEFT,
-                Qt.Key.Key_Right: Direction.RIGHT,
-                Qt.Key.Key_D: Direction.RIGHT,
-            }
-            if key in _dirs:
-                gp.move(_dirs[key])
+            if key in _KEY_DIRECTIONS:
+                gp.move(_KEY_DIRECTIONS[key])
                 if gp.won and not gp.study_mode:
                     self._show_win()
             elif key == Qt.Key.Key_N:
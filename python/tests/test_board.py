@@ -0,0 +1,113 @@
+"""Board model tests.
+
+``is_solved``, ``is_tile_correct`` and ``correctness_mask`` all take
+shortcuts (cached goal layouts, a blank-position early return, one pass
+for the whole board).  Each is compared here with the straightforward
+cell-by-cell rule over the 3×3 fixtures plus hand-picked edge cases and
+generated larger boards.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from backend.engine.gamegenerator import GameGenerator
+from backend.models.board import Board
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent.parent / "fixtures"
+
+
+# -- reference definitions ----------------------------------------------------
+
+
+def _ref_tile_correct(board: Board, row: int, col: int) -> bool:
+    n = board.size
+    val = board.tiles[row][col]
+    if val == 0:
+        return row == n - 1 and col == n - 1
+    return (row, col) == ((val - 1) // n, (val - 1) % n)
+
+
+def _ref_solved(board: Board) -> bool:
+    n = board.size
+    return all(
+        _ref_tile_correct(board, r, c) for r in range(n) for c in range(n)
+    )
+
+
+# -- boards under test --------------------------------------------------------
+
+
+def _edge_boards() -> list[Board]:
+    boards = [GameGenerator.solved(n) for n in (2, 3, 4, 7)]
+    # Blank in its goal cell but two tiles swapped: passes the early
+    # blank-position check, must still fail the full comparison.
+    swapped = GameGenerator.solved(4)
+    row = swapped.tiles[0]
+    row[0], row[1] = row[1], row[0]
+    boards.append(swapped)
+    # One move away from solved: blank not in its goal cell.
+    boards.append(Board.from_flat(3, [1, 2, 3, 4, 5, 6, 7, 0, 8]))
+    return boards
+
+
+def _generated_boards() -> list[Board]:
+    GameGenerator.seed(1234)
+    return [
+        GameGenerator.generate(n) for n in (3, 4, 7, 10, 12) for _ in range(10)
+    ]
+
+
+def _fixture_boards() -> list[Board]:
+    with open(FIXTURES_DIR / "3x3.json") as f:
+        data = json.load(f)
+    return [
+        Board.from_flat(d["size"], [v for row in d["tiles"] for v in row])
+        for d in data
+    ]
+
+
+_BOARDS = _edge_boards() + _generated_boards() + _fixture_boards()
+
+
+# -- flat accessors -----------------------------------------------------------
+
+
+def test_flat_and_blank_index() -> None:
+    for size in (2, 3, 7, 12):
+        board = GameGenerator.generate(size)
+        flat = board.flat()
+        assert flat == [v for row in board.tiles for v in row]
+        assert flat[board.blank_index] == 0
+        # flat() hands out a copy; the board itself is untouched.
+        flat[0] = -1
+        assert board.tiles[0][0] != -1
+        assert Board.from_flat(size, board.flat()) == board
+
+
+# -- correctness --------------------------------------------------------------
+
+
+def test_is_solved_matches_reference() -> None:
+    for board in _BOARDS:
+        assert board.is_solved() == _ref_solved(board), board.tiles
+
+
+def test_is_tile_correct_matches_reference() -> None:
+    for board in _BOARDS:
+        n = board.size
+        for r in range(n):
+            for c in range(n):
+                assert board.is_tile_correct(r, c) == _ref_tile_correct(board, r, c)
+
+
+def test_correctness_mask_matches_reference() -> None:
+    for board in _BOARDS:
+        n = board.size
+        expected = 0
+        for r in range(n):
+            for c in range(n):
+                if _ref_tile_correct(board, r, c):
+                    expected |= 1 << (r * n + c)
+        assert board.correctness_mask() == expected, board.tiles
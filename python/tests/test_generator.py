@@ -0,0 +1,78 @@
+"""Board generator tests — seeding, scramble move table and output validity."""
+
+from __future__ import annotations
+
+from backend.engine.gamegenerator import GameGenerator
+from backend.engine.gamegenerator.generator import _move_table
+from backend.models.board import Board
+
+
+def _inversions(seq: list[int]) -> int:
+    return sum(
+        1 for i in range(len(seq)) for j in range(i + 1, len(seq)) if seq[i] > seq[j]
+    )
+
+
+def _is_solvable(board: Board) -> bool:
+    n = board.size
+    inv = _inversions([v for v in board.flat() if v])
+    if n % 2 == 1:
+        return inv % 2 == 0
+    return (inv + n - 1 - board.blank_pos[0]) % 2 == 0
+
+
+def _draw(seed: int, sizes: tuple[int, ...]) -> list[Board]:
+    GameGenerator.seed(seed)
+    return [GameGenerator.generate(n) for n in sizes]
+
+
+# -- seeding ------------------------------------------------------------------
+
+
+def test_same_seed_same_boards() -> None:
+    sizes = (3, 4, 7, 12, 3)
+    assert _draw(42, sizes) == _draw(42, sizes)
+
+
+def test_different_seed_different_boards() -> None:
+    sizes = (7, 10, 12)
+    assert _draw(1, sizes) != _draw(2, sizes)
+
+
+def test_seed_returns_generator_rng() -> None:
+    rng = GameGenerator.seed(7)
+    first = rng.random()
+    assert GameGenerator.seed(7).random() == first
+
+
+# -- move table ---------------------------------------------------------------
+
+
+def test_move_table() -> None:
+    for size in (2, 3, 5):
+        table = _move_table(size)
+        for r in range(size):
+            for c in range(size):
+                pos = (r, c)
+                neighbors = GameGenerator._neighbors_of(pos, size)
+                assert table[pos, None] == tuple(neighbors)
+                for prev in neighbors:
+                    options = table[pos, prev]
+                    if len(neighbors) > 1:
+                        # Same order as _neighbors_of, minus the cell just left.
+                        assert options == tuple(x for x in neighbors if x != prev)
+                    else:
+                        assert options == (prev,)
+
+
+# -- generated boards ---------------------------------------------------------
+
+
+def test_generate_is_solvable_and_scrambled() -> None:
+    for size in (2, 3, 4, 7, 10, 12):
+        for _ in range(5):
+            board = GameGenerator.generate(size)
+            assert sorted(board.flat()) == list(range(size * size))
+            assert board.flat()[board.blank_index] == 0
+            assert not board.is_solved()
+            assert _is_solvable(board)
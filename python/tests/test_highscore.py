@@ -0,0 +1,142 @@
+"""High-score persistence tests.
+
+Scores are stored as integer milliseconds (``time_ms``); files written
+before that change hold float seconds under ``time`` and must still load.
+The manager keeps an in-memory copy of the scores file and ``reload``
+only re-reads it when the file on disk was replaced, changed or removed.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from backend.models.highscore import HighScoreEntry, HighScoreManager
+
+
+def _entry(
+    moves: int, time_ms: int, date: str = "2025-01-01 12:00"
+) -> HighScoreEntry:
+    return HighScoreEntry(moves=moves, time_ms=time_ms, date=date)
+
+
+# -- round trip ---------------------------------------------------------------
+
+
+def test_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "highscores.json"
+    hs = HighScoreManager(path)
+    hs.add_score(3, _entry(30, 12_345))
+    hs.add_score(3, _entry(20, 50_000))
+    hs.add_score(3, _entry(20, 40_000))
+    hs.add_score(7, _entry(400, 1_000))
+
+    loaded = HighScoreManager(path)
+    assert loaded.get_all_sizes() == [3, 7]
+    # Fewest moves first, then fastest.
+    assert loaded.get_scores(3) == [
+        _entry(20, 40_000),
+        _entry(20, 50_000),
+        _entry(30, 12_345),
+    ]
+    assert loaded.get_scores(7) == [_entry(400, 1_000)]
+    assert not path.with_name(path.name + ".tmp").exists()
+
+
+def test_saves_integer_milliseconds(tmp_path: Path) -> None:
+    path = tmp_path / "highscores.json"
+    HighScoreManager(path).add_score(3, _entry(30, 12_345))
+    assert json.loads(path.read_text()) == {
+        "3": [{"moves": 30, "time_ms": 12_345, "date": "2025-01-01 12:00"}]
+    }
+    assert HighScoreManager(path).get_scores(3)[0].time == 12.345
+
+
+def test_missing_file_is_empty(tmp_path: Path) -> None:
+    hs = HighScoreManager(tmp_path / "nope.json")
+    assert hs.get_all_sizes() == []
+    assert hs.get_scores(3) == []
+
+
+# -- legacy format ------------------------------------------------------------
+
+
+def test_loads_legacy_float_seconds(tmp_path: Path) -> None:
+    path = tmp_path / "highscores.json"
+    path.write_text(
+        json.dumps(
+            {
+                "3": [
+                    {"moves": 25, "time": 61.2704, "date": "2024-05-01 09:30"},
+                    {"moves": 25, "time": 12.5, "date": "2024-05-02 10:00"},
+                ]
+            }
+        )
+    )
+    hs = HighScoreManager(path)
+    assert hs.get_scores(3) == [
+        _entry(25, 12_500, "2024-05-02 10:00"),
+        _entry(25, 61_270, "2024-05-01 09:30"),
+    ]
+
+    # The next save rewrites the file in the new format.
+    hs.add_score(3, _entry(10, 5_000))
+    entries = json.loads(path.read_text())["3"]
+    assert [e["time_ms"] for e in entries] == [5_000, 12_500, 61_270]
+    assert all("time" not in e for e in entries)
+
+
+# -- reload / version ---------------------------------------------------------
+
+
+def test_reload_skips_unchanged_file(tmp_path: Path) -> None:
+    hs = HighScoreManager(tmp_path / "highscores.json")
+    hs.add_score(3, _entry(30, 1_000))
+    version = hs.version
+    hs.reload()
+    assert hs.version == version
+
+
+def test_reload_picks_up_external_changes(tmp_path: Path) -> None:
+    path = tmp_path / "highscores.json"
+    hs = HighScoreManager(path)
+    hs.add_score(3, _entry(30, 1_000))
+    version = hs.version
+
+    HighScoreManager(path).add_score(3, _entry(10, 2_000))
+    hs.reload()
+    assert hs.version > version
+    assert [e.moves for e in hs.get_scores(3)] == [10, 30]
+
+
+def test_reload_sees_rewrite_within_one_mtime_tick(tmp_path: Path) -> None:
+    path = tmp_path / "highscores.json"
+    hs = HighScoreManager(path)
+    hs.add_score(3, _entry(30, 1_000))
+    st = path.stat()
+
+    HighScoreManager(path).add_score(3, _entry(10, 2_000))
+    # Pretend the second write landed in the same timestamp tick.
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    hs.reload()
+    assert [e.moves for e in hs.get_scores(3)] == [10, 30]
+
+
+def test_reload_clears_deleted_file(tmp_path: Path) -> None:
+    path = tmp_path / "highscores.json"
+    hs = HighScoreManager(path)
+    hs.add_score(3, _entry(30, 1_000))
+    version = hs.version
+
+    path.unlink()
+    hs.reload()
+    assert hs.get_all_sizes() == []
+    assert hs.version > version
+
+
+def test_add_score_bumps_version(tmp_path: Path) -> None:
+    hs = HighScoreManager(tmp_path / "highscores.json")
+    before = hs.version
+    hs.add_score(4, _entry(50, 9_000))
+    assert hs.version > before